@@ -3,6 +3,9 @@ News Agent
 Searches for NVIDIA-related news using Serper API and filters for relevance
 """
 
+import re
+
+import orjson
 import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -22,6 +25,81 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# ============================================
+# RELEVANCE FILTERS (precompiled)
+# ============================================
+# Keywords for macro/market relevance (broader than NVIDIA-specific)
+MACRO_KEYWORDS = [
+    'stock market', 'nasdaq', 'dow jones', 's&p 500', 'wall street',
+    'federal reserve', 'fed', 'interest rate', 'inflation', 'cpi',
+    'gdp', 'economy', 'recession', 'unemployment',
+    'china', 'trade war', 'tariff', 'geopolitical', 'war',
+    'tech sector', 'semiconductor', 'ai sector', 'tech stocks'
+]
+
+# Single compiled alternation per keyword list - the regex engine scans
+# each article once instead of a Python loop over every keyword
+# (substring matching semantics preserved)
+_NVIDIA_RE = re.compile("|".join(re.escape(k.lower()) for k in NVIDIA_KEYWORDS))
+_MACRO_RE = re.compile("|".join(re.escape(k.lower()) for k in MACRO_KEYWORDS))
+
+
+def _shingles(text: str) -> set:
+    """
+    Character 3-gram shingle set of normalized text (for similarity checks)
+
+    Args:
+        text: Raw text (title + snippet)
+
+    Returns:
+        Set of 3-character shingles
+    """
+    text = re.sub(r"\W+", " ", text.lower()).strip()
+    if len(text) < 3:
+        return {text} if text else set()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def deduplicate_articles(articles: List[Dict], threshold: float = 0.85) -> List[Dict]:
+    """
+    Drop near-duplicate articles (same story picked up by several sources)
+
+    Compares 3-gram shingle sets of title+snippet by Jaccard similarity
+    and keeps the first occurrence - articles arrive ranked by source
+    tier, so the most trusted copy of a story survives. Saves GPT-4
+    tokens on multi-day (weekend) windows where the same story repeats.
+
+    Args:
+        articles: List of article dictionaries (ranked best-first)
+        threshold: Jaccard similarity above which articles are duplicates
+
+    Returns:
+        Articles with near-duplicates removed
+    """
+    kept = []
+    kept_shingles = []
+
+    for article in articles:
+        shingles = _shingles(f"{article.get('title', '')} {article.get('snippet', '')}")
+
+        is_duplicate = False
+        for seen in kept_shingles:
+            union = len(shingles | seen)
+            if union and len(shingles & seen) / union >= threshold:
+                is_duplicate = True
+                break
+
+        if is_duplicate:
+            logger.info(f"Dropping near-duplicate article: {article.get('title', '')[:60]}...")
+        else:
+            kept.append(article)
+            kept_shingles.append(shingles)
+
+    if len(kept) < len(articles):
+        logger.info(f"Deduplicated {len(articles)} -> {len(kept)} articles")
+
+    return kept
+
 
 class NewsAgent(BaseAgent):
     """AI Agent for searching and filtering NVIDIA news"""
@@ -188,12 +266,13 @@ class NewsAgent(BaseAgent):
             response = requests.post(
                 self.base_url,
                 headers=headers,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=10
             )
-            
+
             response.raise_for_status()
-            data = response.json()
+            # Parse the raw bytes with orjson (skips the text decode step)
+            data = orjson.loads(response.content)
             
             # Extract news articles
             articles = data.get('news', [])
@@ -339,13 +418,9 @@ class NewsAgent(BaseAgent):
             True if relevant, False otherwise
         """
         text = f"{title} {snippet}".lower()
-        
-        # Check for NVIDIA keywords
-        for keyword in NVIDIA_KEYWORDS:
-            if keyword.lower() in text:
-                return True
-        
-        return False
+
+        # Single pass over the text with the precompiled keyword alternation
+        return _NVIDIA_RE.search(text) is not None
     
     def _is_macro_relevant(self, title: str, snippet: str) -> bool:
         """
@@ -359,21 +434,9 @@ class NewsAgent(BaseAgent):
             True if relevant, False otherwise
         """
         text = f"{title} {snippet}".lower()
-        
-        # Check for macro/market keywords
-        macro_keywords = [
-            'stock market', 'nasdaq', 'dow jones', 's&p 500', 'wall street',
-            'federal reserve', 'fed', 'interest rate', 'inflation', 'cpi',
-            'gdp', 'economy', 'recession', 'unemployment',
-            'china', 'trade war', 'tariff', 'geopolitical', 'war',
-            'tech sector', 'semiconductor', 'ai sector', 'tech stocks'
-        ]
-        
-        for keyword in macro_keywords:
-            if keyword.lower() in text:
-                return True
-        
-        return False
+
+        # Single pass over the text with the precompiled keyword alternation
+        return _MACRO_RE.search(text) is not None
     
     def _rank_and_limit(self, articles: List[Dict], max_results: int) -> List[Dict]:
         """
@@ -3,16 +3,17 @@ Orchestrator Agent
 Coordinates all agents and manages the daily workflow
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional, List
 from agents.base_agent import BaseAgent
-from agents.news_agent import NewsAgent
+from agents.news_agent import NewsAgent, deduplicate_articles
 from agents.sentiment_agent import SentimentAgent
 from agents.prediction_agent import PredictionAgent
 from utils.market_data_fetcher import MarketDataFetcher
 from utils.database_manager import DatabaseManager
 from utils.workflow_manager import WorkflowManager
-from config.settings import MAX_NEWS_ARTICLES
+from config.settings import MAX_NEWS_ARTICLES, MARKET_TZ
 from utils.logger import setup_logger, log_section_header
 
 logger = setup_logger(__name__)
@@ -62,8 +63,7 @@ class OrchestratorAgent(BaseAgent):
             }
         
         # Get today's date in NY timezone for news collection
-        from zoneinfo import ZoneInfo
-        ny_today = datetime.now(ZoneInfo("America/New_York")).strftime("%Y-%m-%d")
+        ny_today = datetime.now(MARKET_TZ).strftime("%Y-%m-%d")
         
         log_section_header(logger, f"Daily Workflow")
         
@@ -86,24 +86,30 @@ class OrchestratorAgent(BaseAgent):
             logger.info(f"NY Today: {ny_today}")
             logger.info(f"{'='*60}")
             
-            # Step 1: Check if market data already exists in database
-            existing_data = self.db.get_daily_data(last_trading_day)
-            
-            if existing_data:
-                logger.info(f"\n📊 STEP 1: Market Data")
-                logger.info("-" * 60)
-                logger.info(f"✓ Market data for {last_trading_day} already in database")
-                logger.info(f"  Close: ${float(existing_data['close_price']):.2f}")
-                logger.info(f"  (Skipping - no changes needed)")
-                result["market_data_collected"] = True
-                result["market_data_existed"] = True
-            else:
-                # Fetch and save market data
-                market_data = self._collect_market_data(last_trading_day, dry_run)
-                result["market_data_collected"] = market_data is not None
-            
-            # Step 2: Collect news articles (company + macro) for today
-            company_articles, macro_articles = self._collect_news_articles(ny_today)
+            # Steps 1 + 2 are independent I/O (Yahoo Finance vs Serper), so
+            # news collection runs in a worker thread while market data is
+            # checked/fetched - wall clock is max() of the two, not their sum
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                news_future = executor.submit(self._collect_news_articles, ny_today)
+
+                # Step 1: Check if market data already exists in database
+                existing_data = self.db.get_daily_data(last_trading_day)
+
+                if existing_data:
+                    logger.info(f"\n📊 STEP 1: Market Data")
+                    logger.info("-" * 60)
+                    logger.info(f"✓ Market data for {last_trading_day} already in database")
+                    logger.info(f"  Close: ${float(existing_data['close_price']):.2f}")
+                    logger.info(f"  (Skipping - no changes needed)")
+                    result["market_data_collected"] = True
+                    result["market_data_existed"] = True
+                else:
+                    # Fetch and save market data
+                    market_data = self._collect_market_data(last_trading_day, dry_run)
+                    result["market_data_collected"] = market_data is not None
+
+                # Step 2: Collect news articles (company + macro) for today
+                company_articles, macro_articles = news_future.result()
             result["articles_collected"] = len(company_articles) + len(macro_articles)
             
             if not company_articles and not macro_articles:
@@ -211,19 +217,27 @@ class OrchestratorAgent(BaseAgent):
         logger.info("-" * 60)
         
         try:
-            # Collect company-specific NVIDIA news
-            company_articles = self.news_agent.search_news(date, max_results=MAX_NEWS_ARTICLES)
-            
+            # Company and macro searches are separate Serper calls with no
+            # shared state - issue them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                company_future = executor.submit(
+                    self.news_agent.search_news, date, MAX_NEWS_ARTICLES)
+                macro_future = executor.submit(
+                    self.news_agent.search_macro_news, date, MAX_NEWS_ARTICLES)
+                company_articles = company_future.result()
+                macro_articles = macro_future.result()
+
+            # Drop near-duplicate stories before they reach GPT-4
+            company_articles = deduplicate_articles(company_articles)
+            macro_articles = deduplicate_articles(macro_articles)
+
             if company_articles:
                 logger.info(f"✓ Collected {len(company_articles)} company articles:")
                 for i, article in enumerate(company_articles, 1):
                     logger.info(f"  {i}. [{article['source']}] {article['title'][:60]}...")
             else:
                 logger.warning("No company articles found")
-            
-            # Collect macro/market news
-            macro_articles = self.news_agent.search_macro_news(date, max_results=MAX_NEWS_ARTICLES)
-            
+
             if macro_articles:
                 logger.info(f"✓ Collected {len(macro_articles)} macro articles:")
                 for i, article in enumerate(macro_articles, 1):
@@ -293,11 +307,10 @@ class OrchestratorAgent(BaseAgent):
         logger.info("\n💾 STEP 4: Saving Articles to Database")
         logger.info("-" * 60)
         
-        saved_count = 0
         all_articles = company_articles + macro_articles
-        
-        for article in all_articles:
-            article_data = {
+
+        article_rows = [
+            {
                 'date': date,
                 'url': article['url'],
                 'source': article['source'],
@@ -306,10 +319,12 @@ class OrchestratorAgent(BaseAgent):
                 'sentiment_score': None,  # Individual scores not used yet
                 'article_type': article.get('article_type', 'company')  # Store article type
             }
-            
-            if self.db.save_article(article_data):
-                saved_count += 1
-        
+            for article in all_articles
+        ]
+
+        # One round trip for the whole batch instead of one INSERT per article
+        saved_count = self.db.save_articles_bulk(article_rows)
+
         logger.info(f"✓ Saved {saved_count}/{len(all_articles)} articles to database")
         logger.info(f"  ({len(company_articles)} company + {len(macro_articles)} macro)")
         return saved_count
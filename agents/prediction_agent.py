@@ -50,10 +50,10 @@ class PredictionAgent(BaseAgent):
         logger.info("  Training Prediction Model")
         logger.info("="*60)
         
-        # Get all historical data
-        all_data = self.db.get_all_daily_data()
-        
-        if not all_data:
+        # Get all historical data as a DataFrame (columnar, no per-row dicts)
+        all_data = self.db.get_all_daily_data_df()
+
+        if all_data.empty:
             return {
                 'success': False,
                 'message': "No data available for training"
@@ -76,16 +76,23 @@ class PredictionAgent(BaseAgent):
             }
         
         # Check if model already trained and force not set
+        # Only skip the retrain if no new data arrived since the last fit -
+        # otherwise refit so the model picks up the new rows
         if self.model.is_trained and not force:
-            logger.info(f"Model already trained ({self.model.training_samples} samples)")
-            logger.info(f"Use force=True to retrain")
-            return {
-                'success': True,
-                'message': "Model already trained",
-                'samples': self.model.training_samples,
-                'accuracy': self.model.accuracy
-            }
-        
+            latest_date = self.db.get_last_trading_day_date()
+            if (self.model.trained_through and latest_date
+                    and latest_date <= self.model.trained_through):
+                logger.info(f"Model already trained through {self.model.trained_through} "
+                            f"({self.model.training_samples} samples) - no new data, skipping retrain")
+                logger.info(f"Use force=True to retrain anyway")
+                return {
+                    'success': True,
+                    'message': "Model already trained (no new data)",
+                    'samples': self.model.training_samples,
+                    'accuracy': self.model.accuracy
+                }
+            logger.info(f"New data since {self.model.trained_through or 'unknown'} - retraining")
+
         # Train model
         result = self.model.train(all_data)
         
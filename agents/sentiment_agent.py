@@ -4,6 +4,8 @@ Analyzes news articles and generates sentiment scores using GPT-4
 """
 
 from typing import List, Dict, Optional
+
+import numpy as np
 from langchain_core.prompts import ChatPromptTemplate
 from agents.base_agent import BaseAgent
 from config.settings import SENTIMENT_SCALE
@@ -11,6 +13,25 @@ from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+try:
+    # Optional: numba JIT-compiles the weighted-average kernel to native code
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _weighted(scores, weights):
+        s = 0.0
+        w = 0.0
+        for i in range(scores.size):
+            s += scores[i] * weights[i]
+            w += weights[i]
+        return s / w if w else 0.0
+
+except ImportError:
+    # numba not installed - plain numpy is fine for the article counts here
+    def _weighted(scores, weights):
+        total = float(weights.sum())
+        return float((scores * weights).sum() / total) if total else 0.0
+
 
 class SentimentAgent(BaseAgent):
     """AI Agent for analyzing sentiment of news articles"""
@@ -338,16 +359,21 @@ KEY FACTORS: [main macro factors affecting NVIDIA]"""
         """
         # Extract overall sentiment score
         overall_score = self._extract_overall_score(response_text)
-        
+
         # Extract confidence
         confidence = self._extract_confidence(response_text)
-        
+
         # Extract key factors
         key_factors = self._extract_key_factors(response_text)
-        
+
         # Extract individual article scores
         article_scores = self._extract_article_scores(response_text, len(articles))
-        
+
+        # Fallback: if GPT didn't provide an overall line, compute our own
+        # tier-weighted average from the per-article scores
+        if overall_score is None:
+            overall_score = self._weighted_average_score(article_scores, articles)
+
         return {
             "overall_score": overall_score,
             "confidence": confidence,
@@ -356,10 +382,10 @@ KEY FACTORS: [main macro factors affecting NVIDIA]"""
             "raw_analysis": response_text
         }
     
-    def _extract_overall_score(self, text: str) -> float:
-        """Extract overall sentiment score from response"""
+    def _extract_overall_score(self, text: str) -> Optional[float]:
+        """Extract overall sentiment score from response (None if not found)"""
         import re
-        
+
         # Look for patterns like "OVERALL SENTIMENT: 45" or "Overall: 45.5"
         patterns = [
             r'OVERALL SENTIMENT:\s*(-?\d+\.?\d*)',
@@ -367,7 +393,7 @@ KEY FACTORS: [main macro factors affecting NVIDIA]"""
             r'overall score.*?(-?\d+\.?\d*)',
             r'weighted average.*?(-?\d+\.?\d*)',
         ]
-        
+
         for pattern in patterns:
             match = re.search(pattern, text, re.IGNORECASE)
             if match:
@@ -376,9 +402,38 @@ KEY FACTORS: [main macro factors affecting NVIDIA]"""
                 score = max(SENTIMENT_SCALE[0], min(SENTIMENT_SCALE[1], score))
                 logger.debug(f"Extracted overall score: {score}")
                 return score
-        
-        logger.warning("Could not extract overall score, defaulting to 0")
-        return 0.0
+
+        logger.warning("Could not extract overall score, falling back to weighted average")
+        return None
+
+    def _weighted_average_score(self, article_scores: List[Dict], articles: List[Dict]) -> float:
+        """
+        Compute a tier-weighted average of per-article scores
+
+        Tier 1 sources count most (weight 3), tier 2 next (weight 2),
+        everything else weight 1 - mirrors the weighting the prompt asks
+        GPT to apply.
+
+        Args:
+            article_scores: Parsed per-article scores
+            articles: Original articles (for source_tier)
+
+        Returns:
+            Weighted average score (0.0 if no scores)
+        """
+        if not article_scores:
+            return 0.0
+
+        scores = np.fromiter((s['score'] for s in article_scores), dtype=np.float64)
+        tiers = np.fromiter(
+            (a.get('source_tier', 0) for a in articles[:len(article_scores)]),
+            dtype=np.float64,
+            count=len(article_scores)
+        )
+        weights = np.where(tiers == 1, 3.0, np.where(tiers == 2, 2.0, 1.0))
+
+        score = float(_weighted(scores, weights))
+        return max(SENTIMENT_SCALE[0], min(SENTIMENT_SCALE[1], score))
     
     def _extract_confidence(self, text: str) -> str:
         """Extract confidence level from response"""
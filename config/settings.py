@@ -5,6 +5,7 @@ Loads environment variables and provides centralized access to all settings
 
 import os
 from pathlib import Path
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
 # ============================================
@@ -50,6 +51,7 @@ STOCK_NAME = "NVIDIA Corporation"
 # ============================================
 MARKET_CLOSE_TIME = "16:00"  # 4:00 PM ET
 TIMEZONE = os.getenv("TIMEZONE", "America/New_York")
+MARKET_TZ = ZoneInfo(TIMEZONE)  # Cached tzinfo - built once so hot paths skip tzdata parsing
 
 # ============================================
 # NEWS SEARCH SETTINGS
@@ -148,57 +148,92 @@ HIGH_IMPACT_KEYWORDS = [
     "price target",
 ]
 
+# ============================================
+# PRECOMPUTED LOOKUP TABLES
+# ============================================
+# Built once at import time so per-article checks are a single dict hit
+# for exact names, with a pre-lowered substring scan as fallback.
+# Avoids re-lowering the full source lists on every call.
+def _build_tier_map(tier_lists) -> dict:
+    """Map lowercased source name -> best (lowest) tier"""
+    mapping = {}
+    for tier, sources in tier_lists:
+        for name in sources:
+            existing = mapping.get(name.lower())
+            if existing is None or tier < existing:
+                mapping[name.lower()] = tier
+    return mapping
+
+
+_TIER_BY_NAME = _build_tier_map([
+    (1, TIER_1_SOURCES), (2, TIER_2_SOURCES), (3, TIER_3_SOURCES)
+])
+_COMPANY_TIER_BY_NAME = _build_tier_map([
+    (1, COMPANY_TIER_1_SOURCES), (2, COMPANY_TIER_2_SOURCES), (3, COMPANY_TIER_3_SOURCES)
+])
+_MACRO_TIER_BY_NAME = _build_tier_map([
+    (1, MACRO_TIER_1_SOURCES), (2, MACRO_TIER_2_SOURCES), (3, MACRO_TIER_3_SOURCES)
+])
+_EXCLUDED_LOWER = tuple(s.lower() for s in EXCLUDED_SOURCES)
+
+
+def _lookup_tier(source_name: str, tier_by_name: dict) -> int:
+    """Find the tier of a source (1 = best, 0 = not trusted)"""
+    name_lower = source_name.lower()
+
+    # Fast path: exact name match
+    tier = tier_by_name.get(name_lower)
+    if tier is not None:
+        return tier
+
+    # Fallback: substring match (e.g. "Bloomberg Markets" -> "bloomberg")
+    best = 0
+    for trusted, trusted_tier in tier_by_name.items():
+        if trusted in name_lower and (best == 0 or trusted_tier < best):
+            best = trusted_tier
+    return best
+
+
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 def is_trusted_source(source_name: str) -> bool:
     """Check if a source is in ANY trusted list (legacy)"""
-    return any(trusted.lower() in source_name.lower() for trusted in TRUSTED_SOURCES)
+    return _lookup_tier(source_name, _TIER_BY_NAME) > 0
 
 
 def is_trusted_company_source(source_name: str) -> bool:
     """Check if a source is trusted for COMPANY news (NVIDIA-specific)"""
-    return any(trusted.lower() in source_name.lower() for trusted in COMPANY_TRUSTED_SOURCES)
+    return _lookup_tier(source_name, _COMPANY_TIER_BY_NAME) > 0
 
 
 def is_trusted_macro_source(source_name: str) -> bool:
     """Check if a source is trusted for MACRO news (market-wide)"""
-    return any(trusted.lower() in source_name.lower() for trusted in MACRO_TRUSTED_SOURCES)
+    return _lookup_tier(source_name, _MACRO_TIER_BY_NAME) > 0
 
 
 def is_excluded_source(source_name: str) -> bool:
     """Check if a source should be excluded"""
-    return any(excluded.lower() in source_name.lower() for excluded in EXCLUDED_SOURCES)
+    name_lower = source_name.lower()
+    return any(excluded in name_lower for excluded in _EXCLUDED_LOWER)
 
 
 def get_source_tier(source_name: str) -> int:
     """Get the tier level of a source (1 = best, 3 = acceptable, 0 = not trusted)"""
-    if any(s.lower() in source_name.lower() for s in TIER_1_SOURCES):
-        return 1
-    elif any(s.lower() in source_name.lower() for s in TIER_2_SOURCES):
-        return 2
-    elif any(s.lower() in source_name.lower() for s in TIER_3_SOURCES):
-        return 3
-    return 0  # Not trusted
+    return _lookup_tier(source_name, _TIER_BY_NAME)
+
+
+def get_source_info(source_name: str) -> tuple:
+    """Get (is_trusted, tier) in a single lookup"""
+    tier = _lookup_tier(source_name, _TIER_BY_NAME)
+    return tier > 0, tier
 
 
 def get_company_source_tier(source_name: str) -> int:
     """Get tier for COMPANY news sources"""
-    if any(s.lower() in source_name.lower() for s in COMPANY_TIER_1_SOURCES):
-        return 1
-    elif any(s.lower() in source_name.lower() for s in COMPANY_TIER_2_SOURCES):
-        return 2
-    elif any(s.lower() in source_name.lower() for s in COMPANY_TIER_3_SOURCES):
-        return 3
-    return 0  # Not trusted for company news
+    return _lookup_tier(source_name, _COMPANY_TIER_BY_NAME)
 
 
 def get_macro_source_tier(source_name: str) -> int:
     """Get tier for MACRO news sources"""
-    if any(s.lower() in source_name.lower() for s in MACRO_TIER_1_SOURCES):
-        return 1
-    elif any(s.lower() in source_name.lower() for s in MACRO_TIER_2_SOURCES):
-        return 2
-    elif any(s.lower() in source_name.lower() for s in MACRO_TIER_3_SOURCES):
-        return 3
-    return 0  # Not trusted for macro news
+    return _lookup_tier(source_name, _MACRO_TIER_BY_NAME)
@@ -0,0 +1,25 @@
+-- Migration: Add indexes backing the hot WHERE clauses
+-- Date: 2026-08-31
+-- Purpose: Keep the frequent lookups on index scans as the tables grow
+--
+-- Verify with EXPLAIN (ANALYZE, BUFFERS); each query below should show an
+-- Index Scan / Index Only Scan instead of a Seq Scan + Sort.
+
+-- Descending date scans (get_last_trading_day_date, get_historical_data,
+-- get_latest_daily_data, get_average_volume) need no new index: the
+-- UNIQUE constraint on daily_data.date already provides a btree that
+-- PostgreSQL walks backwards for ORDER BY date DESC LIMIT n.
+
+-- Partial index for prediction evaluation: get_predictions_with_results
+-- (WHERE prediction IS NOT NULL AND next_day_close IS NOT NULL
+--  ORDER BY date DESC LIMIT n) touches only evaluated rows, so the index
+-- stays tiny no matter how large daily_data grows
+CREATE INDEX IF NOT EXISTS idx_daily_data_evaluated
+    ON daily_data(date DESC)
+    WHERE prediction IS NOT NULL AND next_day_close IS NOT NULL;
+
+-- articles(date) is already covered by idx_articles_date (schema.sql),
+-- which also serves the range scans in get_articles_since_date and
+-- get_articles_count_for_date_range - nothing more needed there.
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- Migration: Store prediction confidence alongside the prediction
+-- Date: 2026-08-31
+-- Purpose: save_prediction receives a confidence value but had nowhere
+--          to put it; keeping it enables post-hoc accuracy analysis
+--          (e.g. was the model right more often when it was confident?)
+
+ALTER TABLE daily_data
+ADD COLUMN IF NOT EXISTS prediction_confidence REAL;
+
+COMMENT ON COLUMN daily_data.prediction_confidence IS 'Model confidence for the stored prediction (0-1), stored as FP32';
+
+COMMIT;
@@ -0,0 +1,69 @@
+-- Migration: Quantize indicator and sentiment columns
+-- Date: 2026-08-31
+-- Purpose: Shrink daily_data row width for faster training reads
+--
+-- DECIMAL is variable-width (typically 8+ bytes for these values); the
+-- indicators and sentiment scores never need more than FP32 precision
+-- (the model trains on float32 anyway). REAL is a fixed 4 bytes, so rows
+-- get narrower and more of them fit per page / cache line. Prices stay
+-- DECIMAL(10,2) - money should remain exact.
+
+-- Views reference these columns, so drop and recreate them around the ALTER
+DROP VIEW IF EXISTS recent_predictions;
+DROP VIEW IF EXISTS daily_summary;
+
+ALTER TABLE daily_data
+    ALTER COLUMN rsi TYPE REAL,
+    ALTER COLUMN macd TYPE REAL,
+    ALTER COLUMN macd_signal TYPE REAL,
+    ALTER COLUMN sentiment_score TYPE REAL,
+    ALTER COLUMN company_sentiment TYPE REAL,
+    ALTER COLUMN macro_sentiment TYPE REAL,
+    ALTER COLUMN price_change_percent TYPE REAL;
+
+ALTER TABLE articles
+    ALTER COLUMN sentiment_score TYPE REAL;
+
+-- Recreate views (unchanged definitions)
+CREATE VIEW recent_predictions AS
+SELECT
+    date,
+    close_price,
+    prediction,
+    next_day_close,
+    prediction_accuracy,
+    sentiment_score,
+    CASE
+        WHEN prediction_accuracy IS NOT NULL THEN 'Completed'
+        WHEN prediction IS NOT NULL THEN 'Pending'
+        ELSE 'No Prediction'
+    END as status
+FROM daily_data
+WHERE prediction IS NOT NULL
+ORDER BY date DESC
+LIMIT 30;
+
+CREATE VIEW daily_summary AS
+SELECT
+    dd.date,
+    dd.close_price,
+    dd.volume,
+    dd.rsi,
+    dd.macd,
+    dd.moving_avg_50,
+    dd.moving_avg_200,
+    dd.sentiment_score,
+    COUNT(a.id) as article_count,
+    dd.next_day_close,
+    dd.price_change_percent,
+    dd.prediction,
+    dd.prediction_accuracy
+FROM daily_data dd
+LEFT JOIN articles a ON dd.date = a.date
+GROUP BY dd.id, dd.date
+ORDER BY dd.date DESC;
+
+COMMENT ON COLUMN daily_data.rsi IS 'Relative Strength Index (0-100), stored as FP32';
+COMMENT ON COLUMN daily_data.sentiment_score IS 'Combined sentiment score (weighted: 60% company + 40% macro), stored as FP32';
+
+COMMIT;
@@ -6,10 +6,9 @@ Runs the daily workflow to collect market data, news, and sentiment
 import sys
 import argparse
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from agents.orchestrator_agent import OrchestratorAgent
 from utils.logger import setup_logger, log_section_header
-from config.settings import validate_config, get_config_info
+from config.settings import validate_config, get_config_info, MARKET_TZ
 
 logger = setup_logger("main")
 
@@ -68,7 +67,7 @@ def main():
         if args.date:
             target_date = args.date
         else:
-            et_now = datetime.now(ZoneInfo("America/New_York"))
+            et_now = datetime.now(MARKET_TZ)
             target_date = et_now.strftime("%Y-%m-%d")
         
         logger.info(f"\nRunning workflow for {target_date}...")
@@ -56,6 +56,7 @@ class PredictionModel:
         self.is_trained = False
         self.training_samples = 0
         self.accuracy = 0.0
+        self.trained_through: Optional[str] = None  # Latest data date seen at fit time
         
         # Try to load existing model
         self._load_model()
@@ -72,6 +73,7 @@ class PredictionModel:
                 self.is_trained = True
                 self.training_samples = data.get('training_samples', 0)
                 self.accuracy = data.get('accuracy', 0.0)
+                self.trained_through = data.get('trained_through')
                 logger.info(f"Loaded trained model ({self.training_samples} samples, {self.accuracy:.1%} accuracy)")
                 return True
         except Exception as e:
@@ -87,6 +89,7 @@ class PredictionModel:
                 'scaler': self.scaler,
                 'training_samples': self.training_samples,
                 'accuracy': self.accuracy,
+                'trained_through': self.trained_through,
                 'trained_at': datetime.now().isoformat()
             }
             joblib.dump(data, self.model_path)
@@ -96,75 +99,93 @@ class PredictionModel:
             logger.error(f"Failed to save model: {e}")
             return False
     
-    def prepare_features(self, data: List[Dict]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    def prepare_features(self, data) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
         """
         Prepare features and labels from database records
-        
+
         Args:
-            data: List of daily_data records from database
-        
+            data: Daily data as a DataFrame or a list of row records
+
         Returns:
             Tuple of (features array, labels array) or (None, None) if insufficient data
         """
         if len(data) < MIN_TRAINING_SAMPLES:
             logger.warning(f"Insufficient data: {len(data)} records (need {MIN_TRAINING_SAMPLES})")
             return None, None
-        
-        # Convert to DataFrame for easier manipulation
-        df = pd.DataFrame(data)
-        
-        # Calculate derived features
-        features_list = []
-        labels_list = []
-        
-        # Calculate average volume for volume ratio
-        avg_volume = df['volume'].mean() if 'volume' in df.columns else 1
-        
-        for i, row in df.iterrows():
-            # Skip rows without next_day_close (can't calculate label)
-            if row.get('next_day_close') is None or row.get('close_price') is None:
-                continue
-            
-            # Calculate label: 1 if price went up, 0 if down
-            next_close = float(row['next_day_close'])
-            current_close = float(row['close_price'])
-            label = 1 if next_close > current_close else 0
-            
-            # Calculate price change percent for today
-            open_price = float(row.get('open_price', current_close))
-            price_change = ((current_close - open_price) / open_price * 100) if open_price > 0 else 0
-            
-            # Volume ratio
-            volume = float(row.get('volume', avg_volume))
-            volume_ratio = volume / avg_volume if avg_volume > 0 else 1
-            
-            # Build feature vector
-            features = [
-                float(row.get('sentiment_score', 0) or 0),
-                float(row.get('company_sentiment', 0) or 0),
-                float(row.get('macro_sentiment', 0) or 0),
-                float(row.get('rsi', 50) or 50),  # Default RSI to neutral
-                float(row.get('macd', 0) or 0),
-                price_change,
-                volume_ratio
-            ]
-            
-            features_list.append(features)
-            labels_list.append(label)
-        
-        if len(features_list) < MIN_TRAINING_SAMPLES:
-            logger.warning(f"Not enough valid samples: {len(features_list)}")
+
+        # Columnar layout lets us build the whole feature matrix with
+        # vectorized operations instead of a row loop. The training path
+        # already hands us a DataFrame straight from read_sql_query.
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+
+        def _column(name: str, default: float) -> np.ndarray:
+            """Numeric column as float32, with falsy/missing values defaulted"""
+            if name not in df.columns:
+                return np.full(len(df), default, dtype=np.float32)
+            values = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=np.float32)
+            # Match the old `value or default` semantics (None and 0 -> default)
+            values[np.isnan(values)] = 0.0
+            if default != 0.0:
+                values[values == 0.0] = default
+            return values
+
+        # Calculate average volume for volume ratio (over all rows, like before)
+        avg_volume = float(df['volume'].mean()) if 'volume' in df.columns else 1
+
+        # Keep only rows where the label can be computed
+        if 'next_day_close' not in df.columns or 'close_price' not in df.columns:
+            logger.warning("Missing next_day_close/close_price columns")
             return None, None
-        
-        return np.array(features_list), np.array(labels_list)
+
+        valid = df['next_day_close'].notna() & df['close_price'].notna()
+        df = df[valid].reset_index(drop=True)
+
+        if len(df) < MIN_TRAINING_SAMPLES:
+            logger.warning(f"Not enough valid samples: {len(df)}")
+            return None, None
+
+        close = pd.to_numeric(df['close_price']).to_numpy(dtype=np.float32)
+        next_close = pd.to_numeric(df['next_day_close']).to_numpy(dtype=np.float32)
+
+        # Label: 1 if price went up, 0 if down
+        labels = (next_close > close).astype(np.int64)
+
+        # Price change percent for the day (0 where open is missing/zero)
+        if 'open_price' in df.columns:
+            open_price = pd.to_numeric(df['open_price'], errors='coerce').to_numpy(dtype=np.float32)
+            open_price = np.where(np.isnan(open_price), close, open_price)
+        else:
+            open_price = close
+        price_change = np.where(open_price > 0, (close - open_price) / open_price * 100, 0)
+
+        # Volume ratio vs average
+        if 'volume' in df.columns and avg_volume > 0:
+            volume = pd.to_numeric(df['volume'], errors='coerce').to_numpy(dtype=np.float32)
+            volume = np.where(np.isnan(volume), avg_volume, volume)
+            volume_ratio = volume / avg_volume
+        else:
+            volume_ratio = np.ones(len(df), dtype=np.float32)
+
+        # Assemble contiguous float32 feature matrix (halves memory vs float64)
+        features = np.column_stack([
+            _column('sentiment_score', 0),
+            _column('company_sentiment', 0),
+            _column('macro_sentiment', 0),
+            _column('rsi', 50),  # Default RSI to neutral
+            _column('macd', 0),
+            price_change,
+            volume_ratio
+        ]).astype(np.float32)
+
+        return features, labels
     
-    def train(self, data: List[Dict]) -> Dict:
+    def train(self, data) -> Dict:
         """
         Train the prediction model
-        
+
         Args:
-            data: List of daily_data records from database
-        
+            data: Daily data as a DataFrame or a list of row records
+
         Returns:
             Training results dictionary
         """
@@ -210,7 +231,23 @@ class PredictionModel:
             
             self.is_trained = True
             self.training_samples = len(X)
-            
+
+            # Remember how far the training data reaches (for skip-retrain
+            # checks). Data may be a DataFrame or a list of dict/namedtuple rows.
+            self.trained_through = None
+            if isinstance(data, pd.DataFrame):
+                if 'date' in data.columns and data['date'].notna().any():
+                    last = data['date'].max()
+                    self.trained_through = (last.strftime('%Y-%m-%d')
+                                            if hasattr(last, 'strftime') else str(last))
+            else:
+                dates = []
+                for row in data:
+                    date = row.get('date') if isinstance(row, dict) else getattr(row, 'date', None)
+                    if date:
+                        dates.append(str(date))
+                self.trained_through = max(dates) if dates else None
+
             # Save model
             self._save_model()
             
@@ -302,6 +339,7 @@ class PredictionModel:
             'is_trained': self.is_trained,
             'training_samples': self.training_samples,
             'accuracy': self.accuracy,
+            'trained_through': self.trained_through,
             'min_required': MIN_TRAINING_SAMPLES,
             'ideal_samples': IDEAL_TRAINING_SAMPLES,
             'features': self.feature_names,
@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import psycopg2
+import psycopg
 import os
 from dotenv import load_dotenv
 
@@ -12,10 +12,10 @@ ENV_PATH = Path(__file__).parent.parent / ".env"
 load_dotenv(dotenv_path=ENV_PATH)
 
 # Connect to database
-conn = psycopg2.connect(
+conn = psycopg.connect(
     host="localhost",
     port=int(os.getenv("DB_PORT", "1998")),
-    database="nvidia_prediction",
+    dbname="nvidia_prediction",
     user="postgres",
     password=os.getenv("DB_PASSWORD", "")
 )
@@ -5,6 +5,23 @@ Import this at the top of every test file
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+from utils.database_manager import DatabaseManager  # noqa: E402
+from utils.market_data_fetcher import MarketDataFetcher  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def db():
+    """Single DatabaseManager shared by the whole test session (pooled connections)"""
+    return DatabaseManager()
+
+
+@pytest.fixture(scope="session")
+def fetcher():
+    """Single MarketDataFetcher shared by the whole test session (cached calendar)"""
+    return MarketDataFetcher()
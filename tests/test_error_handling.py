@@ -1,71 +1,53 @@
 """
 Test error handling for closed market scenarios
+
+Pytest-style: uses the session-scoped `fetcher`/`db` fixtures from
+conftest.py so heavy modules (yfinance, pandas, psycopg2) are imported
+and initialized once for the whole test session.
 """
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+
+
+def test_weekend_fetch_returns_none_without_crash(fetcher):
+    """Fetching a Saturday should return None, not crash"""
+    data = fetcher.fetch_daily_data('2026-01-11')  # Saturday
+    assert data is None or 'close_price' in data
 
-from utils.market_data_fetcher import MarketDataFetcher
-from utils.database_manager import DatabaseManager
 
-print("\n" + "="*60)
-print("Testing Market Closed Error Handling")
-print("="*60 + "\n")
+def test_trading_day_fetch_returns_requested_date(fetcher):
+    """Fetching a known trading day must return that exact date's bar"""
+    data = fetcher.fetch_daily_data('2026-01-09')  # Friday
+    assert data is not None
+    assert data['date'] == '2026-01-09'
+    assert data['close_price'] > 0
 
-fetcher = MarketDataFetcher()
-db = DatabaseManager()
 
-# Test 1: Try weekend date (Saturday)
-print("Test 1: Fetching data for Saturday (market closed)")
-print("-" * 60)
-data = fetcher.fetch_daily_data('2026-01-11')  # Saturday
-if data:
-    print(f"✓ Got data: ${data['close_price']}")
-else:
-    print("✓ Correctly returned None (no crash!)")
-print()
+def test_weekend_fetch_with_fallback(fetcher):
+    """With use_last_trading_day=True we should get the previous trading day"""
+    data = fetcher.fetch_daily_data('2026-01-11', use_last_trading_day=True)
+    assert data is not None
+    assert data['date'] != '2026-01-11'
+    assert data['close_price'] > 0
 
-# Test 2: Try weekend date with fallback to last trading day
-print("Test 2: Fetching with auto-fallback to last trading day")
-print("-" * 60)
-data = fetcher.fetch_daily_data('2026-01-11', use_last_trading_day=True)
-if data:
-    print(f"✓ Got last trading day data: {data['date']} - ${data['close_price']}")
-else:
-    print("✗ Failed to get data")
-print()
 
-# Test 3: Check market status for different days
-print("Test 3: Check market status")
-print("-" * 60)
-test_dates = [
-    ('2026-01-09', 'Friday'),
-    ('2026-01-10', 'Saturday'),
-    ('2026-01-11', 'Sunday'),
-    ('2026-01-12', 'Monday')
-]
+@pytest.mark.parametrize("date,day,expected_open", [
+    ('2026-01-09', 'Friday', True),
+    ('2026-01-10', 'Saturday', False),
+    ('2026-01-11', 'Sunday', False),
+    ('2026-01-12', 'Monday', True),
+])
+def test_market_status(fetcher, date, day, expected_open):
+    """Market status should match the weekday calendar"""
+    assert fetcher.is_market_open(date) == expected_open, f"{date} ({day})"
 
-for date, day in test_dates:
-    is_open = fetcher.is_market_open(date)
-    status = "✓ OPEN" if is_open else "✗ CLOSED"
-    print(f"{date} ({day:9}): {status}")
-print()
 
-# Test 4: Get last trading day
-print("Test 4: Get last trading day")
-print("-" * 60)
-last_day = fetcher.get_last_trading_day()
-print(f"Last trading day: {last_day}")
-print()
+def test_get_last_trading_day(fetcher):
+    """Last trading day should be a YYYY-MM-DD string"""
+    last_day = fetcher.get_last_trading_day()
+    assert last_day is not None
+    assert len(last_day) == 10
 
-# Test 5: Save None to database (should handle gracefully)
-print("Test 5: Try saving None to database")
-print("-" * 60)
-result = db.save_daily_data(None) if False else "Skipped (would cause error)"
-print(f"Result: {result}")
-print()
 
-print("="*60)
-print("✓ All error handling tests passed!")
-print("✓ No crashes when market is closed")
-print("="*60)
+def test_save_none_to_database(db):
+    """Saving None should be handled gracefully, not raise"""
+    assert db.save_daily_data(None) is False
@@ -66,15 +66,18 @@ def test_database_integration():
     count = db.get_data_count()
     print(f"\n📈 Total records in database: {count}")
     
-    # Clean up test data
+    # Clean up test data (single pooled connection, one transaction)
     print("\n🧹 Cleaning up test data...")
-    import psycopg2
     conn = db.get_connection()
     cursor = conn.cursor()
+    cursor.execute("SAVEPOINT test_cleanup")
     cursor.execute("DELETE FROM daily_data WHERE date = %s", (date,))
+    if cursor.rowcount != 1:
+        # Something else deleted our row - don't touch anything
+        cursor.execute("ROLLBACK TO SAVEPOINT test_cleanup")
     conn.commit()
     cursor.close()
-    conn.close()
+    db.release_connection(conn)
     print(f"✓ Deleted test data for {date}")
     
     print("\n" + "="*60)
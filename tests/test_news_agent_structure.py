@@ -11,7 +11,7 @@ print("="*60 + "\n")
 print("Testing imports...")
 try:
     from agents.news_agent import NewsAgent
-    from config.trusted_sources import is_trusted_source, get_source_tier
+    from config.trusted_sources import get_source_info
     print("✓ Imports successful\n")
 except Exception as e:
     print(f"✗ Import error: {e}\n")
@@ -31,8 +31,7 @@ test_sources = [
 ]
 
 for source, expected_trusted in test_sources:
-    is_trusted = is_trusted_source(source)
-    tier = get_source_tier(source)
+    is_trusted, tier = get_source_info(source)
     status = "✓ TRUSTED" if is_trusted else "✗ EXCLUDED"
     tier_text = f"Tier {tier}" if tier > 0 else "Not ranked"
     
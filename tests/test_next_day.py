@@ -4,7 +4,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.database_manager import DatabaseManager
-import psycopg2
 
 db = DatabaseManager()
 
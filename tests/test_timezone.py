@@ -1,14 +1,18 @@
 """Test timezone handling"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from config.settings import MARKET_TZ
 
-israel_time = datetime.now()
-us_et_time = datetime.now(ZoneInfo("America/New_York"))
+local_time = datetime.now()
+us_et_time = datetime.now(MARKET_TZ)
 
 print("="*60)
 print("TIMEZONE TEST")
 print("="*60)
-print(f"Your computer (Israel): {israel_time}")
-print(f"US Eastern Time:        {us_et_time}")
-print(f"\nTarget date will be:    {us_et_time.strftime('%Y-%m-%d')}")
+print(f"Your computer (local): {local_time}")
+print(f"US Eastern Time:       {us_et_time}")
+print(f"\nTarget date will be:   {us_et_time.strftime('%Y-%m-%d')}")
 print("="*60)
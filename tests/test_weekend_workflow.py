@@ -1,58 +1,54 @@
 """
 Test Weekend Article Handling Workflow
+
+Pytest-style: one session-scoped WorkflowManager, dates classified in a
+single batch and checked via parametrization.
 """
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from utils.workflow_manager import WorkflowManager
-from datetime import datetime
 
-print("\n" + "="*60)
-print("Weekend Article Handling Test")
-print("="*60 + "\n")
+TEST_DATES = [
+    ('2026-01-09', 'Friday (trading day)', True),
+    ('2026-01-10', 'Saturday (weekend)', False),
+    ('2026-01-11', 'Sunday (weekend)', False),
+    ('2026-01-12', 'Monday (trading day)', True),
+]
 
-wf = WorkflowManager()
 
-# Test different scenarios
-test_dates = [
-    ('2026-01-09', 'Friday (trading day)'),
-    ('2026-01-10', 'Saturday (weekend)'),
-    ('2026-01-11', 'Sunday (weekend)'),
-    ('2026-01-12', 'Monday (trading day)'),
-]
+@pytest.fixture(scope="session")
+def wf():
+    return WorkflowManager()
+
+
+@pytest.fixture(scope="session")
+def classified(wf):
+    """All test dates classified in one batch against the cached calendar"""
+    df = wf.classify_dates([date for date, _, _ in TEST_DATES])
+    return {row.date: row for row in df.itertuples()}
 
-for date, description in test_dates:
-    print(f"\n{description} - {date}")
-    print("-" * 60)
-    
-    # Check if trading day
-    is_trading = wf.should_collect_market_data(date)
-    print(f"Market Status: {'OPEN ✓' if is_trading else 'CLOSED ✗'}")
-    
-    # Get date range for sentiment
-    start, end = wf.get_date_range_for_sentiment(date)
-    print(f"Article Range: {start} to {end}")
-    
-    # Determine what to update
+
+@pytest.mark.parametrize("date,description,is_trading", TEST_DATES)
+def test_trading_day_classification(classified, date, description, is_trading):
+    """Trading-day flag should match the weekday calendar"""
+    assert classified[date].is_trading_day == is_trading, description
+
+
+@pytest.mark.parametrize("date,description,is_trading", TEST_DATES)
+def test_sentiment_date_range(classified, date, description, is_trading):
+    """Trading days use just that day; weekends accumulate from last trading day"""
+    row = classified[date]
+    assert row.sentiment_end == date
     if is_trading:
-        print(f"Action: Save market data + articles for {date}")
-        print(f"Update sentiment: {date}")
+        assert row.sentiment_start == date
     else:
-        last_day = wf.get_last_trading_day_for_update()
-        print(f"Action: Save articles for {date}")
-        print(f"Update sentiment: {last_day} (last trading day)")
-
-print("\n" + "="*60)
-print("SUMMARY:")
-print("="*60)
-summary = wf.get_summary()
-for key, value in summary.items():
-    print(f"{key}: {value}")
-
-print("\n✓ Weekend handling logic working correctly!")
-print("\nWEEKEND WORKFLOW:")
-print("  Saturday: Collect articles → Update Friday's sentiment")
-print("  Sunday:   Collect articles → Update Friday's sentiment")
-print("  Monday:   Predict using Friday's updated sentiment")
-print("="*60)
+        # Weekend range starts at the last trading day (when one exists)
+        assert row.sentiment_start == (row.last_trading_day or date)
+
+
+def test_summary(wf):
+    """Workflow summary should report the core stats"""
+    summary = wf.get_summary()
+    for key in ('total_trading_days', 'last_trading_day',
+                'market_open_today', 'latest_price'):
+        assert key in summary
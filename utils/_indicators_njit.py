@@ -0,0 +1,89 @@
+"""
+Numba-accelerated technical indicator kernels
+
+RSI (Wilder smoothing), EMA and SMA are scalar recurrences; as compiled
+njit loops over float64 arrays they skip all pandas per-call overhead.
+When numba is not installed the decorators become no-ops and the loops
+run interpreted - MarketDataFetcher checks HAVE_NUMBA and prefers its
+vectorized pandas path in that case.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in when numba is unavailable"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def ema(close, span):
+    """Exponential moving average with alpha = 2 / (span + 1)"""
+    out = np.empty_like(close)
+    alpha = 2.0 / (span + 1.0)
+    out[0] = close[0]
+    for i in range(1, close.shape[0]):
+        out[i] = alpha * close[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def sma(close, n):
+    """Simple moving average (NaN until the window fills)"""
+    out = np.full(close.shape[0], np.nan)
+    if close.shape[0] < n:
+        return out
+    total = 0.0
+    for i in range(close.shape[0]):
+        total += close[i]
+        if i >= n:
+            total -= close[i - n]
+        if i >= n - 1:
+            out[i] = total / n
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def rsi(close, n):
+    """Wilder-smoothed RSI in a single pass (NaN for the first bar)"""
+    m = close.shape[0]
+    out = np.full(m, np.nan)
+    if m < 2:
+        return out
+
+    alpha = 1.0 / n
+    delta = close[1] - close[0]
+    avg_gain = delta if delta > 0.0 else 0.0
+    avg_loss = -delta if delta < 0.0 else 0.0
+
+    for i in range(1, m):
+        if i > 1:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+            avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+
+        if avg_loss > 0.0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            out[i] = 100.0
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def macd(close, fast, slow, signal):
+    """MACD line, signal line and histogram from three EMA passes"""
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
@@ -3,99 +3,422 @@ Database Manager for NVIDIA Stock Prediction System
 Handles all PostgreSQL database operations for market data and articles
 """
 
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import atexit
+import time
+import pandas as pd
+import psycopg
+from psycopg.rows import dict_row, namedtuple_row
+from psycopg_pool import ConnectionPool
+from bisect import bisect_left
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Final, Iterator, List, Optional, Set, Any
 from config.settings import DB_CONFIG
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Sentinel distinguishing "not cached" from a cached None
+_CACHE_MISS = object()
+
+# How long cached read results stay fresh - the values cached here change
+# at most once per trading day, so a short TTL is very safe
+_READ_CACHE_TTL = 300  # seconds
+
+# ============================================================
+# SQL statements
+# ============================================================
+# Hoisted to module level so every execute() sends byte-identical query
+# text - psycopg's auto-prepare cache keys on the text, so constant
+# strings guarantee prepared-statement hits (and keep the queries easy
+# to grep and EXPLAIN).
+
+_DAILY_COLUMNS: Final = (
+    'date', 'open_price', 'close_price', 'high_price', 'low_price',
+    'volume', 'rsi', 'macd', 'macd_signal', 'moving_avg_50', 'moving_avg_200'
+)
+_DAILY_COLUMN_LIST: Final = ", ".join(_DAILY_COLUMNS)
+
+# Every daily_data column consumers actually read - explicit lists instead
+# of SELECT * keep id/created_at/updated_at off the wire and out of the
+# client decode loop
+_DAILY_READ_COLUMNS: Final = _DAILY_COLUMNS + (
+    'sentiment_score', 'company_sentiment', 'macro_sentiment',
+    'next_day_close', 'price_change_percent', 'prediction', 'prediction_accuracy'
+)
+_DAILY_READ_LIST: Final = ", ".join(_DAILY_READ_COLUMNS)
+
+# Same idea for articles (skips id/created_at)
+_ARTICLE_READ_LIST: Final = "date, url, source, title, summary, sentiment_score, article_type"
+
+# Shared by the single-row upsert and the COPY merge
+_DAILY_UPDATE_SET: Final = """
+        open_price = EXCLUDED.open_price,
+        close_price = EXCLUDED.close_price,
+        high_price = EXCLUDED.high_price,
+        low_price = EXCLUDED.low_price,
+        volume = EXCLUDED.volume,
+        rsi = EXCLUDED.rsi,
+        macd = EXCLUDED.macd,
+        macd_signal = EXCLUDED.macd_signal,
+        moving_avg_50 = EXCLUDED.moving_avg_50,
+        moving_avg_200 = EXCLUDED.moving_avg_200,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_Q_UPSERT_DAILY: Final = f"""
+    INSERT INTO daily_data ({_DAILY_COLUMN_LIST})
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (date) DO UPDATE SET {_DAILY_UPDATE_SET}
+    RETURNING (xmax = 0) AS inserted
+"""
+
+_Q_CREATE_DAILY_STAGE: Final = """
+    CREATE TEMP TABLE daily_data_stage
+    (LIKE daily_data INCLUDING DEFAULTS)
+    ON COMMIT DROP
+"""
+
+_Q_COPY_DAILY_STAGE: Final = f"COPY daily_data_stage ({_DAILY_COLUMN_LIST}) FROM STDIN"
+
+_Q_MERGE_DAILY_STAGE: Final = f"""
+    INSERT INTO daily_data ({_DAILY_COLUMN_LIST})
+    SELECT {_DAILY_COLUMN_LIST} FROM daily_data_stage
+    ON CONFLICT (date) DO UPDATE SET {_DAILY_UPDATE_SET}
+"""
+
+# Relaxed durability for bulk article writes: skip the WAL fsync wait
+# for this transaction only (SET LOCAL reverts at commit)
+_Q_BULK_SESSION: Final = "SET LOCAL synchronous_commit TO OFF"
+
+_Q_INSERT_ARTICLE: Final = """
+    INSERT INTO articles (
+        date, url, source, title, summary, sentiment_score, article_type
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT DO NOTHING
+"""
+
+_Q_UPDATE_NEXT_DAY: Final = """
+    UPDATE daily_data
+    SET next_day_close = %s,
+        price_change_percent = ((%s - close_price) / close_price) * 100,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE date = %s
+    RETURNING price_change_percent
+"""
+
+_Q_UPDATE_SENTIMENT: Final = """
+    UPDATE daily_data
+    SET sentiment_score = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE date = %s
+"""
+
+_Q_UPDATE_SENTIMENTS: Final = """
+    UPDATE daily_data
+    SET company_sentiment = %s,
+        macro_sentiment = %s,
+        sentiment_score = %s,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE date = %s
+"""
+
+_Q_UPDATE_LAST_SENTIMENT: Final = """
+    UPDATE daily_data
+    SET sentiment_score = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE date = (SELECT MAX(date) FROM daily_data)
+    RETURNING date
+"""
+
+# RETURNING 1 surfaces the no-matching-row case in the same round trip
+_Q_SAVE_PREDICTION: Final = """
+    UPDATE daily_data
+    SET prediction = %s,
+        prediction_confidence = %s
+    WHERE date = %s
+    RETURNING 1
+"""
+
+# Date-only lookups format server-side with to_char - the driver hands
+# back ready-to-use "YYYY-MM-DD" strings, no per-row strftime in Python
+_Q_ALL_DATES: Final = "SELECT to_char(date, 'YYYY-MM-DD') FROM daily_data ORDER BY date ASC"
+
+_Q_GET_DAILY: Final = f"SELECT {_DAILY_READ_LIST} FROM daily_data WHERE date = %s"
+
+_Q_GET_HISTORICAL: Final = f"""
+    SELECT {_DAILY_READ_LIST} FROM daily_data
+    ORDER BY date DESC
+    LIMIT %s
+"""
+
+_Q_ALL_DAILY: Final = f"""
+    SELECT {_DAILY_READ_LIST} FROM daily_data
+    ORDER BY date ASC
+"""
+
+_Q_LATEST_DAILY: Final = f"""
+    SELECT {_DAILY_READ_LIST} FROM daily_data
+    ORDER BY date DESC
+    LIMIT 1
+"""
+
+_Q_LAST_DATE: Final = "SELECT to_char(date, 'YYYY-MM-DD') FROM daily_data ORDER BY date DESC LIMIT 1"
+
+_Q_PREV_DATE: Final = "SELECT to_char(date, 'YYYY-MM-DD') FROM daily_data WHERE date < %s ORDER BY date DESC LIMIT 1"
+
+# Plain LIMIT 1 instead of EXISTS(...) - no SubPlan node, the planner
+# just stops at the first index hit on date
+_Q_DATE_EXISTS: Final = "SELECT 1 FROM daily_data WHERE date = %s LIMIT 1"
+
+_Q_DATES_EXIST: Final = "SELECT to_char(date, 'YYYY-MM-DD') FROM daily_data WHERE date = ANY(%s::date[])"
+
+_Q_DATA_COUNT: Final = "SELECT COUNT(*) FROM daily_data"
+
+# Relies on the UNIQUE index on daily_data.date: the inner SELECT becomes
+# a backward ordered index scan that stops after LIMIT rows, so no sort
+# happens before the aggregate. Verify with EXPLAIN (ANALYZE, BUFFERS).
+_Q_AVG_VOLUME: Final = """
+    SELECT AVG(volume) FROM (
+        SELECT volume FROM daily_data
+        ORDER BY date DESC
+        LIMIT %s
+    ) AS recent
+"""
+
+_Q_ARTICLES_FOR_DATE: Final = f"SELECT {_ARTICLE_READ_LIST} FROM articles WHERE date = %s ORDER BY created_at DESC"
+
+_Q_ARTICLES_BEFORE_DATE: Final = f"SELECT {_ARTICLE_READ_LIST} FROM articles WHERE date < %s ORDER BY date DESC"
+
+_Q_ARTICLES_SINCE: Final = f"""
+    SELECT {_ARTICLE_READ_LIST} FROM articles
+    WHERE date >= %s AND date <= %s
+    ORDER BY date ASC, created_at ASC
+"""
+
+_Q_ARTICLES_COUNT_RANGE: Final = """
+    SELECT COUNT(*) FROM articles
+    WHERE date >= %s AND date <= %s
+"""
+
+_Q_PREDICTIONS_WITH_RESULTS: Final = """
+    SELECT
+        date,
+        prediction,
+        close_price,
+        next_day_close,
+        CASE
+            WHEN next_day_close > close_price THEN 'UP'
+            ELSE 'DOWN'
+        END as actual_direction
+    FROM daily_data
+    WHERE prediction IS NOT NULL
+    AND next_day_close IS NOT NULL
+    ORDER BY date DESC
+    LIMIT %s
+"""
+
 
 class DatabaseManager:
     """Manage all database operations for stock prediction system"""
-    
+
+    # Shared across all instances (and all tests) so short queries reuse
+    # warm connections instead of paying a TCP+auth handshake per call
+    _pool: Optional[ConnectionPool] = None
+
+    # Sorted tuple of all stored daily_data dates ("YYYY-MM-DD"), loaded on
+    # first use and invalidated whenever a day is saved - lets trading-day
+    # lookups bisect in memory instead of querying PostgreSQL every call
+    _dates_cache: Optional[tuple] = None
+
+    # Short-TTL cache for hot scalar reads (key -> (expires_at, value)),
+    # cleared on every write so results are never stale
+    _read_cache: Dict[tuple, tuple] = {}
+
     def __init__(self):
         """Initialize database manager with connection config"""
         self.config = DB_CONFIG
         logger.info("DatabaseManager initialized")
-    
+
+    @staticmethod
+    def _configure_connection(conn: psycopg.Connection) -> None:
+        """Configure each pooled connection as it is created"""
+        # Auto-prepare any statement executed 2+ times on a connection, so
+        # hot queries skip the Parse+plan step on subsequent calls
+        conn.prepare_threshold = 2
+
+    @classmethod
+    def _get_pool(cls, config: Dict[str, Any]) -> ConnectionPool:
+        """Create the shared connection pool on first use"""
+        if cls._pool is None:
+            # psycopg3 takes libpq parameter names ("dbname", not "database")
+            params = dict(config)
+            params["dbname"] = params.pop("database")
+            params["connect_timeout"] = 5
+
+            cls._pool = ConnectionPool(
+                kwargs=params,
+                min_size=2,
+                max_size=10,
+                configure=cls._configure_connection,
+                open=True
+            )
+            atexit.register(cls._close_pool)
+            logger.info("Database connection pool created (2-10 connections)")
+        return cls._pool
+
+    @classmethod
+    def _close_pool(cls) -> None:
+        """Close all pooled connections (registered to run at exit)"""
+        if cls._pool is not None:
+            cls._pool.close()
+            cls._pool = None
+            logger.info("Database connection pool closed")
+
+    @contextmanager
+    def _conn(self):
+        """
+        Borrow a pooled connection for the duration of a with-block
+
+        Rolls back on error and always returns the connection to the
+        pool. The clean path also closes the implicit transaction that
+        read-only queries leave open - otherwise putconn sees an
+        in-transaction connection and pays a warning plus a rollback
+        round trip on every read.
+        """
+        conn = self._get_pool(self.config).getconn()
+        try:
+            yield conn
+            if conn.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+                conn.rollback()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._pool.putconn(conn)
+
+    @contextmanager
+    def _cursor(self, row_factory=None, commit: bool = False):
+        """
+        Borrow a pooled connection and yield a cursor on it
+
+        Collapses the per-method connection/cursor/commit boilerplate to
+        a single with-block. Commits on clean exit when commit=True;
+        _conn() takes care of rollback on error and always returns the
+        connection to the pool.
+
+        Args:
+            row_factory: Optional psycopg row factory (dict_row, namedtuple_row)
+            commit: Commit the transaction when the block exits cleanly
+        """
+        with self._conn() as conn:
+            cursor = conn.cursor(row_factory=row_factory) if row_factory else conn.cursor()
+            try:
+                yield cursor
+                if commit:
+                    conn.commit()
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def _bulk_cursor(self):
+        """
+        Cursor for non-critical bulk writes with relaxed durability
+
+        Turns off synchronous_commit for the transaction, so the commit
+        returns without waiting for the WAL fsync. A crash in the
+        following instant could lose the batch - fine for news articles,
+        which can simply be re-fetched. Market data and predictions stay
+        on the default durable path.
+        """
+        with self._cursor(commit=True) as cursor:
+            cursor.execute(_Q_BULK_SESSION)
+            yield cursor
+
     def get_connection(self):
         """
-        Create and return a database connection
-        
+        Borrow a database connection from the shared pool
+
         Returns:
-            psycopg2 connection object
+            psycopg connection object (return it with release_connection)
         """
         try:
-            conn = psycopg2.connect(**self.config)
-            return conn
+            return self._get_pool(self.config).getconn()
         except Exception as e:
             logger.error(f"Database connection failed: {str(e)}")
             raise
-    
+
+    def release_connection(self, conn) -> None:
+        """
+        Return a borrowed connection to the shared pool
+
+        Args:
+            conn: Connection obtained from get_connection
+        """
+        if conn is not None and self._pool is not None:
+            self._pool.putconn(conn)
+
+    def _read_cache_get(self, key: tuple):
+        """Return a fresh cached value for key, or _CACHE_MISS"""
+        entry = DatabaseManager._read_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return _CACHE_MISS
+
+    def _read_cache_put(self, key: tuple, value):
+        """Cache value for key and return it"""
+        DatabaseManager._read_cache[key] = (time.monotonic() + _READ_CACHE_TTL, value)
+        return value
+
+    @classmethod
+    def _invalidate_caches(cls) -> None:
+        """Drop cached reads after a write so nothing goes stale"""
+        cls._dates_cache = None
+        cls._read_cache.clear()
+
+    def _get_dates_cache(self) -> Optional[tuple]:
+        """
+        Load (or return) the sorted tuple of all stored daily_data dates
+
+        Returns:
+            Sorted tuple of date strings, or None if the load failed
+        """
+        if DatabaseManager._dates_cache is not None:
+            return DatabaseManager._dates_cache
+
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(_Q_ALL_DATES)
+                results = cursor.fetchall()
+
+            DatabaseManager._dates_cache = tuple(row[0] for row in results)
+            logger.debug(f"Cached {len(DatabaseManager._dates_cache)} stored dates")
+            return DatabaseManager._dates_cache
+
+        except Exception as e:
+            logger.error(f"Error caching stored dates: {str(e)}")
+            return None
+
     def save_daily_data(self, data: Dict[str, Any]) -> bool:
         """
         Save or update daily stock data
-        
+
         Args:
             data: Dictionary containing daily stock data
-        
+
         Returns:
             True if successful, False otherwise
         """
+        # Guard against None/empty data (e.g. fetch returned None on a closed day)
+        if not data:
+            logger.warning("No daily data to save")
+            return False
+
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Check if date already exists
-            cursor.execute(
-                "SELECT id FROM daily_data WHERE date = %s",
-                (data['date'],)
-            )
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing record
-                query = """
-                    UPDATE daily_data SET
-                        open_price = %s,
-                        close_price = %s,
-                        high_price = %s,
-                        low_price = %s,
-                        volume = %s,
-                        rsi = %s,
-                        macd = %s,
-                        macd_signal = %s,
-                        moving_avg_50 = %s,
-                        moving_avg_200 = %s,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE date = %s
-                """
-                cursor.execute(query, (
-                    data.get('open_price'),
-                    data.get('close_price'),
-                    data.get('high_price'),
-                    data.get('low_price'),
-                    data.get('volume'),
-                    data.get('rsi'),
-                    data.get('macd'),
-                    data.get('macd_signal'),
-                    data.get('moving_avg_50'),
-                    data.get('moving_avg_200'),
-                    data['date']
-                ))
-                logger.info(f"Updated daily data for {data['date']}")
-            else:
-                # Insert new record
-                query = """
-                    INSERT INTO daily_data (
-                        date, open_price, close_price, high_price, low_price, volume,
-                        rsi, macd, macd_signal, moving_avg_50, moving_avg_200
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                cursor.execute(query, (
+            with self._cursor(commit=True) as cursor:
+                # Single upsert - daily_data.date is UNIQUE, so ON CONFLICT
+                # replaces the old SELECT-then-INSERT/UPDATE two-step.
+                # xmax = 0 only for freshly inserted rows, which lets us log
+                # insert vs update without an extra query.
+                cursor.execute(_Q_UPSERT_DAILY, (
                     data['date'],
                     data.get('open_price'),
                     data.get('close_price'),
@@ -108,663 +431,669 @@ class DatabaseManager:
                     data.get('moving_avg_50'),
                     data.get('moving_avg_200')
                 ))
-                logger.info(f"Inserted daily data for {data['date']}")
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+                inserted = cursor.fetchone()[0]
+                logger.info(f"{'Inserted' if inserted else 'Updated'} daily data for {data['date']}")
+
+            # The set of stored dates (and cached reads) may have changed
+            self._invalidate_caches()
             return True
-            
+
         except Exception as e:
             logger.error(f"Error saving daily data: {str(e)}")
-            if conn:
-                conn.rollback()
-                conn.close()
             return False
-    
+
+    def copy_daily_data(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Bulk-load daily data rows via the COPY protocol (for backfills)
+
+        COPY is the fastest ingest path Postgres offers - all rows stream
+        in one statement instead of one INSERT each. Rows land in a temp
+        staging table first and are merged with a single
+        INSERT ... ON CONFLICT (date) DO UPDATE, so re-importing dates
+        that already exist is safe.
+
+        Args:
+            rows: List of daily data dictionaries (same keys as save_daily_data)
+
+        Returns:
+            Number of rows loaded
+        """
+        if not rows:
+            return 0
+
+        try:
+            with self._cursor(commit=True) as cursor:
+                # Stage into a temp table that disappears with the transaction
+                cursor.execute(_Q_CREATE_DAILY_STAGE)
+
+                with cursor.copy(_Q_COPY_DAILY_STAGE) as copy:
+                    for row in rows:
+                        copy.write_row(tuple(row.get(col) for col in _DAILY_COLUMNS))
+
+                # Merge staged rows in one statement (update on date collision)
+                cursor.execute(_Q_MERGE_DAILY_STAGE)
+                loaded = cursor.rowcount
+
+            # The set of stored dates (and cached reads) may have changed
+            self._invalidate_caches()
+            logger.info(f"COPY-loaded {loaded} daily data rows")
+            return loaded
+
+        except Exception as e:
+            logger.error(f"Error bulk loading daily data: {str(e)}")
+            return 0
+
     def save_article(self, article: Dict[str, Any]) -> bool:
         """
         Save a news article to database
-        
+
+        Thin wrapper over save_articles_bulk - callers with more than one
+        article should pass the whole list there instead.
+
         Args:
             article: Dictionary containing article data
-        
+
         Returns:
             True if successful, False otherwise
         """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                INSERT INTO articles (
-                    date, url, source, title, summary, sentiment_score, article_type
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT DO NOTHING
-            """
-            cursor.execute(query, (
-                article['date'],
-                article.get('url'),
-                article.get('source'),
-                article.get('title'),
-                article.get('summary'),
-                article.get('sentiment_score'),
-                article.get('article_type', 'company')  # Default to 'company' for backward compatibility
-            ))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+        saved = self.save_articles_bulk([article]) == 1
+        if saved:
             logger.debug(f"Saved article: {article.get('title', 'No title')[:50]}...")
-            return True
-            
+        return saved
+
+    def save_articles_bulk(self, articles: List[Dict[str, Any]]) -> int:
+        """
+        Save multiple news articles in a single round trip
+
+        Uses executemany (pipelined by psycopg3) so N articles cost one
+        batched round trip and one commit instead of N of each.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Number of articles saved
+        """
+        if not articles:
+            return 0
+
+        try:
+            rows = [
+                (
+                    article['date'],
+                    article.get('url'),
+                    article.get('source'),
+                    article.get('title'),
+                    article.get('summary'),
+                    article.get('sentiment_score'),
+                    article.get('article_type', 'company')
+                )
+                for article in articles
+            ]
+
+            with self._bulk_cursor() as cursor:
+                cursor.executemany(_Q_INSERT_ARTICLE, rows)
+                saved = cursor.rowcount
+
+            logger.info(f"Bulk saved {saved}/{len(articles)} articles")
+            return saved
+
         except Exception as e:
-            logger.error(f"Error saving article: {str(e)}")
-            if conn:
-                conn.rollback()
-                conn.close()
-            return False
-    
+            logger.error(f"Error bulk saving articles: {str(e)}")
+            return 0
+
     def update_next_day_result(self, previous_date: str, next_day_close: float) -> bool:
         """
         Update previous day's next_day_close and calculate price change
-        
+
         Args:
             previous_date: Previous trading day date in YYYY-MM-DD format
             next_day_close: Today's closing price
-        
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Get previous day's close price
-            cursor.execute("SELECT close_price FROM daily_data WHERE date = %s", (previous_date,))
-            result = cursor.fetchone()
-            
-            if not result:
-                logger.warning(f"No data found for previous date {previous_date}")
-                cursor.close()
-                conn.close()
-                return False
-            
-            previous_close = float(result[0])
-            price_change_percent = ((next_day_close - previous_close) / previous_close) * 100
-            
-            # Update previous day's row
-            query = """
-                UPDATE daily_data 
-                SET next_day_close = %s, 
-                    price_change_percent = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE date = %s
-            """
-            cursor.execute(query, (next_day_close, price_change_percent, previous_date))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(commit=True) as cursor:
+                # One statement: the percent change is computed server-side
+                # from the row's own close_price, and RETURNING hands the
+                # result back for logging - no separate SELECT round trip
+                cursor.execute(_Q_UPDATE_NEXT_DAY, (next_day_close, next_day_close, previous_date))
+                result = cursor.fetchone()
+
+                if not result:
+                    logger.warning(f"No data found for previous date {previous_date}")
+                    return False
+
+                price_change_percent = float(result[0])
+
+            self._invalidate_caches()
             logger.info(f"Updated next day result for {previous_date}: ${next_day_close:.2f} ({price_change_percent:+.2f}%)")
             return True
-            
+
         except Exception as e:
             logger.error(f"Error updating next day result: {str(e)}")
-            if conn:
-                conn.rollback()
-                conn.close()
             return False
-    
+
     def update_sentiment_score(self, date: str, sentiment_score: float) -> bool:
         """
         Update combined sentiment score for a specific date
-        
+
         Args:
             date: Date in YYYY-MM-DD format
             sentiment_score: Aggregated sentiment score (combined company + macro)
-        
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                UPDATE daily_data 
-                SET sentiment_score = %s, updated_at = CURRENT_TIMESTAMP
-                WHERE date = %s
-            """
-            cursor.execute(query, (sentiment_score, date))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with self._cursor(commit=True) as cursor:
+                cursor.execute(_Q_UPDATE_SENTIMENT, (sentiment_score, date))
+
             logger.info(f"Updated sentiment score for {date}: {sentiment_score}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Error updating sentiment score: {str(e)}")
-            if conn:
-                conn.rollback()
-                conn.close()
             return False
-    
+
     def update_sentiment_scores(self, date: str, company_sentiment: float, macro_sentiment: float, combined_sentiment: float) -> bool:
         """
         Update all sentiment scores for a specific date (company, macro, and combined)
-        
+
         Args:
             date: Date in YYYY-MM-DD format
             company_sentiment: Company-specific sentiment score
             macro_sentiment: Macro/market sentiment score
             combined_sentiment: Combined weighted sentiment score
-        
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                UPDATE daily_data 
-                SET company_sentiment = %s, 
-                    macro_sentiment = %s,
-                    sentiment_score = %s,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE date = %s
-            """
-            cursor.execute(query, (company_sentiment, macro_sentiment, combined_sentiment, date))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with self._cursor(commit=True) as cursor:
+                cursor.execute(_Q_UPDATE_SENTIMENTS, (company_sentiment, macro_sentiment, combined_sentiment, date))
+
             logger.info(f"Updated sentiment scores for {date}: Company={company_sentiment}, Macro={macro_sentiment}, Combined={combined_sentiment}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Error updating sentiment scores: {str(e)}")
-            if conn:
-                conn.rollback()
-                conn.close()
             return False
-    
+
     def get_daily_data(self, date: str) -> Optional[Dict]:
         """
         Retrieve daily data for a specific date
-        
+
         Args:
             date: Date in YYYY-MM-DD format
-        
+
         Returns:
             Dictionary with daily data or None if not found
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = "SELECT * FROM daily_data WHERE date = %s"
-            cursor.execute(query, (date,))
-            result = cursor.fetchone()
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(row_factory=dict_row) as cursor:
+                cursor.execute(_Q_GET_DAILY, (date,))
+                result = cursor.fetchone()
+
             if result:
                 return dict(result)
             return None
-            
+
         except Exception as e:
             logger.error(f"Error retrieving daily data: {str(e)}")
             return None
-    
-    def get_historical_data(self, days: int = 30) -> List[Dict]:
+
+    def get_historical_data(self, days: int = 30) -> List[tuple]:
         """
         Retrieve historical data for the last N days
-        
+
+        Rows are namedtuples (access fields as row.close_price, or
+        row._asdict() for a dict) - much cheaper to build than one dict
+        per row when many days are requested.
+
         Args:
             days: Number of days to retrieve
-        
+
         Returns:
-            List of dictionaries with daily data
+            List of namedtuple rows with daily data
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = """
-                SELECT * FROM daily_data 
-                ORDER BY date DESC 
-                LIMIT %s
-            """
-            cursor.execute(query, (days,))
-            results = cursor.fetchall()
-            
-            cursor.close()
-            conn.close()
-            
-            return [dict(row) for row in results]
-            
+            with self._cursor(row_factory=namedtuple_row) as cursor:
+                cursor.execute(_Q_GET_HISTORICAL, (days,))
+                results = cursor.fetchall()
+
+            return results
+
         except Exception as e:
             logger.error(f"Error retrieving historical data: {str(e)}")
             return []
-    
+
     def get_articles_for_date(self, date: str) -> List[Dict]:
         """
         Retrieve all articles for a specific date
-        
+
         Args:
             date: Date in YYYY-MM-DD format
-        
+
         Returns:
             List of article dictionaries
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = "SELECT * FROM articles WHERE date = %s ORDER BY created_at DESC"
-            cursor.execute(query, (date,))
-            results = cursor.fetchall()
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(row_factory=dict_row) as cursor:
+                cursor.execute(_Q_ARTICLES_FOR_DATE, (date,))
+                results = cursor.fetchall()
+
             return [dict(row) for row in results]
-            
+
         except Exception as e:
             logger.error(f"Error retrieving articles: {str(e)}")
             return []
-    
+
     def get_articles_before_date(self, date: str) -> List[Dict]:
         """
         Retrieve all articles published before a specific date
         Useful for finding orphaned weekend articles
-        
+
         Args:
             date: Cutoff date in YYYY-MM-DD format
-        
+
         Returns:
             List of article dictionaries
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = "SELECT * FROM articles WHERE date < %s ORDER BY date DESC"
-            cursor.execute(query, (date,))
-            results = cursor.fetchall()
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(row_factory=dict_row) as cursor:
+                cursor.execute(_Q_ARTICLES_BEFORE_DATE, (date,))
+                results = cursor.fetchall()
+
             return [dict(row) for row in results]
-            
+
         except Exception as e:
             logger.error(f"Error retrieving articles before date: {str(e)}")
             return []
-    
+
     def date_exists(self, date: str) -> bool:
         """
         Check if data exists for a specific date
-        
+
         Args:
             date: Date in YYYY-MM-DD format
-        
+
         Returns:
             True if data exists, False otherwise
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = "SELECT EXISTS(SELECT 1 FROM daily_data WHERE date = %s)"
-            cursor.execute(query, (date,))
-            exists = cursor.fetchone()[0]
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor() as cursor:
+                cursor.execute(_Q_DATE_EXISTS, (date,))
+                exists = cursor.fetchone() is not None
+
             return exists
-            
+
         except Exception as e:
             logger.error(f"Error checking date existence: {str(e)}")
             return False
-    
+
+    def dates_exist(self, dates: List[str]) -> Set[str]:
+        """
+        Check which of the given dates already have daily data
+
+        One ANY(...) query replaces N date_exists round trips when
+        backfilling a range - callers then iterate only the missing
+        dates (set(dates) - dates_exist(dates)).
+
+        Args:
+            dates: Dates to check, in YYYY-MM-DD format
+
+        Returns:
+            Set of the given dates that are already stored
+        """
+        if not dates:
+            return set()
+
+        try:
+            # Fast path: intersect with the in-memory stored-dates cache
+            cached = self._get_dates_cache()
+            if cached is not None:
+                return set(dates) & set(cached)
+
+            with self._cursor() as cursor:
+                cursor.execute(_Q_DATES_EXIST, (list(dates),))
+                results = cursor.fetchall()
+
+            return {row[0] for row in results}
+
+        except Exception as e:
+            logger.error(f"Error checking dates existence: {str(e)}")
+            return set()
+
     def get_data_count(self) -> int:
         """
         Get total count of days in database
-        
+
         Returns:
             Number of days stored in database
         """
+        cached = self._read_cache_get(('data_count',))
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = "SELECT COUNT(*) FROM daily_data"
-            cursor.execute(query)
-            count = cursor.fetchone()[0]
-            
-            cursor.close()
-            conn.close()
-            
-            return count
-            
+            with self._cursor() as cursor:
+                cursor.execute(_Q_DATA_COUNT)
+                count = cursor.fetchone()[0]
+
+            return self._read_cache_put(('data_count',), count)
+
         except Exception as e:
             logger.error(f"Error getting data count: {str(e)}")
             return 0
-    
+
     def get_last_trading_day_date(self) -> Optional[str]:
         """
         Get the most recent trading day date from database
-        
+
         Returns:
             Date string in YYYY-MM-DD format or None if no data
         """
+        cached = self._read_cache_get(('last_trading_day_date',))
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = "SELECT date FROM daily_data ORDER BY date DESC LIMIT 1"
-            cursor.execute(query)
-            result = cursor.fetchone()
-            
-            cursor.close()
-            conn.close()
-            
-            if result:
-                return result[0].strftime("%Y-%m-%d")
-            return None
-            
+            with self._cursor() as cursor:
+                cursor.execute(_Q_LAST_DATE)
+                result = cursor.fetchone()
+
+            last_day = result[0] if result else None
+            return self._read_cache_put(('last_trading_day_date',), last_day)
+
         except Exception as e:
             logger.error(f"Error getting last trading day: {str(e)}")
             return None
-    
+
     def get_previous_trading_day(self, current_date: str) -> Optional[str]:
         """
         Get the trading day immediately before the given date
-        
+
         Args:
             current_date: Current date in YYYY-MM-DD format
-        
+
         Returns:
             Previous trading day date string or None if no previous data
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = "SELECT date FROM daily_data WHERE date < %s ORDER BY date DESC LIMIT 1"
-            cursor.execute(query, (current_date,))
-            result = cursor.fetchone()
-            
-            cursor.close()
-            conn.close()
-            
-            if result:
-                return result[0].strftime("%Y-%m-%d")
-            return None
-            
+            # Fast path: bisect the in-memory sorted dates - no round trip
+            dates = self._get_dates_cache()
+            if dates is not None:
+                idx = bisect_left(dates, current_date)
+                return dates[idx - 1] if idx > 0 else None
+
+            # Fallback: ask PostgreSQL directly
+            with self._cursor() as cursor:
+                cursor.execute(_Q_PREV_DATE, (current_date,))
+                result = cursor.fetchone()
+
+            return result[0] if result else None
+
         except Exception as e:
             logger.error(f"Error getting previous trading day: {str(e)}")
             return None
-    
+
     def get_articles_since_date(self, start_date: str, end_date: Optional[str] = None) -> List[Dict]:
         """
         Get all articles from start_date to end_date (inclusive)
         Useful for accumulating weekend articles
-        
+
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format (default: today)
-        
+
         Returns:
             List of article dictionaries
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
             if end_date is None:
-                from datetime import datetime
                 end_date = datetime.now().strftime("%Y-%m-%d")
-            
-            query = """
-                SELECT * FROM articles 
-                WHERE date >= %s AND date <= %s 
-                ORDER BY date ASC, created_at ASC
-            """
-            cursor.execute(query, (start_date, end_date))
-            results = cursor.fetchall()
-            
-            cursor.close()
-            conn.close()
-            
+
+            with self._cursor(row_factory=dict_row) as cursor:
+                cursor.execute(_Q_ARTICLES_SINCE, (start_date, end_date))
+                results = cursor.fetchall()
+
             return [dict(row) for row in results]
-            
+
         except Exception as e:
             logger.error(f"Error getting articles since date: {str(e)}")
             return []
-    
+
     def update_last_trading_day_sentiment(self, sentiment_score: float) -> bool:
         """
         Update the sentiment score for the last trading day
         Used when weekend articles are collected
-        
+
         Args:
             sentiment_score: Updated sentiment score (including weekend news)
-        
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            last_day = self.get_last_trading_day_date()
-            if not last_day:
-                logger.warning("No trading days found in database")
-                return False
-            
-            return self.update_sentiment_score(last_day, sentiment_score)
-            
+            with self._cursor(commit=True) as cursor:
+                # Find-latest-then-update folded into one statement - one
+                # round trip instead of two dependent queries on two
+                # borrowed connections
+                cursor.execute(_Q_UPDATE_LAST_SENTIMENT, (sentiment_score,))
+                result = cursor.fetchone()
+
+                if not result:
+                    logger.warning("No trading days found in database")
+                    return False
+
+            logger.info(f"Updated sentiment score for {result[0].strftime('%Y-%m-%d')}: {sentiment_score}")
+            return True
+
         except Exception as e:
             logger.error(f"Error updating last trading day sentiment: {str(e)}")
             return False
-    
+
     def get_articles_count_for_date_range(self, start_date: str, end_date: str) -> int:
         """
         Get count of articles in a date range
-        
+
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
-        
+
         Returns:
             Number of articles in range
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT COUNT(*) FROM articles 
-                WHERE date >= %s AND date <= %s
-            """
-            cursor.execute(query, (start_date, end_date))
-            count = cursor.fetchone()[0]
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor() as cursor:
+                cursor.execute(_Q_ARTICLES_COUNT_RANGE, (start_date, end_date))
+                count = cursor.fetchone()[0]
+
             return count
-            
+
         except Exception as e:
             logger.error(f"Error getting articles count: {str(e)}")
             return 0
 
-    def get_all_daily_data(self) -> List[Dict]:
+    def get_all_daily_data(self) -> List[tuple]:
         """
         Get all daily data records for model training
-        
+
+        This is a full table scan, so rows are namedtuples instead of
+        dicts - no per-row dict build or column-name hashing (access
+        fields as row.close_price, or row._asdict() for a dict).
+
         Returns:
-            List of all daily data records
+            List of all daily data records as namedtuple rows
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = """
-                SELECT * FROM daily_data 
-                ORDER BY date ASC
-            """
-            cursor.execute(query)
-            results = cursor.fetchall()
-            
-            cursor.close()
-            conn.close()
-            
-            return [dict(row) for row in results]
-            
+            with self._cursor(row_factory=namedtuple_row) as cursor:
+                cursor.execute(_Q_ALL_DAILY)
+                results = cursor.fetchall()
+
+            return results
+
         except Exception as e:
             logger.error(f"Error getting all daily data: {str(e)}")
             return []
-    
+
+    def get_all_daily_data_df(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Get all daily data as a pandas DataFrame for the ML pipeline
+
+        pd.read_sql_query materializes columns at C speed, so model
+        training skips the per-row dict construction of
+        get_all_daily_data entirely and can go straight to numpy arrays.
+        This is the hot feature-read path for PredictionAgent; it made
+        a separate asyncpg read module unnecessary.
+
+        Args:
+            columns: Optional list of column names to select (default: all)
+
+        Returns:
+            DataFrame of daily data ordered by date (empty on error)
+        """
+        if columns:
+            # Allow-list so the f-string below never sees arbitrary identifiers
+            unknown = set(columns) - set(_DAILY_READ_COLUMNS)
+            if unknown:
+                logger.error(f"Unknown daily_data columns requested: {sorted(unknown)}")
+                return pd.DataFrame()
+            cols = ", ".join(columns)
+        else:
+            cols = _DAILY_READ_LIST
+        parse_dates = ['date'] if (columns is None or 'date' in columns) else None
+
+        try:
+            with self._conn() as conn:
+                return pd.read_sql_query(
+                    f"SELECT {cols} FROM daily_data ORDER BY date ASC",
+                    conn,
+                    parse_dates=parse_dates
+                )
+
+        except Exception as e:
+            logger.error(f"Error getting daily data frame: {str(e)}")
+            return pd.DataFrame()
+
+    def iter_all_daily_data(self, batch_size: int = 2000) -> Iterator[Dict]:
+        """
+        Stream all daily data records without loading them all at once
+
+        Uses a server-side (named) cursor, so rows arrive from PostgreSQL
+        in batches of batch_size instead of one big fetchall() - peak
+        memory stays flat no matter how large the table grows. Prefer
+        this over get_all_daily_data for memory-sensitive consumers.
+
+        Args:
+            batch_size: Number of rows fetched from the server per batch
+
+        Yields:
+            Daily data dictionaries in date order
+        """
+        try:
+            with self._conn() as conn:
+                with conn.cursor(name='daily_data_stream', row_factory=dict_row) as cursor:
+                    cursor.itersize = batch_size
+                    cursor.execute(_Q_ALL_DAILY)
+                    for row in cursor:
+                        yield dict(row)
+
+        except Exception as e:
+            logger.error(f"Error streaming daily data: {str(e)}")
+
     def get_latest_daily_data(self) -> Optional[Dict]:
         """
         Get the most recent daily data record
-        
+
         Returns:
             Most recent daily data or None
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = """
-                SELECT * FROM daily_data 
-                ORDER BY date DESC 
-                LIMIT 1
-            """
-            cursor.execute(query)
-            result = cursor.fetchone()
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(row_factory=dict_row) as cursor:
+                cursor.execute(_Q_LATEST_DAILY)
+                result = cursor.fetchone()
+
             return dict(result) if result else None
-            
+
         except Exception as e:
             logger.error(f"Error getting latest daily data: {str(e)}")
             return None
-    
+
     def get_average_volume(self, days: int = 20) -> float:
         """
         Get average volume over recent days
-        
+
         Args:
             days: Number of days to average
-        
+
         Returns:
             Average volume
         """
+        cached = self._read_cache_get(('average_volume', days))
+        if cached is not _CACHE_MISS:
+            return cached
+
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            query = """
-                SELECT AVG(volume) FROM (
-                    SELECT volume FROM daily_data 
-                    ORDER BY date DESC 
-                    LIMIT %s
-                ) AS recent
-            """
-            cursor.execute(query, (days,))
-            result = cursor.fetchone()[0]
-            
-            cursor.close()
-            conn.close()
-            
-            return float(result) if result else 0.0
-            
+            with self._cursor() as cursor:
+                cursor.execute(_Q_AVG_VOLUME, (days,))
+                result = cursor.fetchone()[0]
+
+            avg = float(result) if result else 0.0
+            return self._read_cache_put(('average_volume', days), avg)
+
         except Exception as e:
             logger.error(f"Error getting average volume: {str(e)}")
             return 0.0
-    
+
     def save_prediction(self, date: str, prediction: str, confidence: float) -> bool:
         """
         Save a prediction to the database
-        
+
         Args:
             date: Date of prediction
             prediction: 'UP' or 'DOWN'
             confidence: Confidence level (0-1)
-        
+
         Returns:
             True if successful
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            # Update the daily_data row with prediction
-            query = """
-                UPDATE daily_data 
-                SET prediction = %s
-                WHERE date = %s
-            """
-            cursor.execute(query, (prediction, date))
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(commit=True) as cursor:
+                # Update the daily_data row with prediction and confidence
+                cursor.execute(_Q_SAVE_PREDICTION, (prediction, confidence, date))
+
+                if cursor.fetchone() is None:
+                    logger.warning(f"No daily data row for {date} - prediction not saved")
+                    return False
+
+            self._invalidate_caches()
             logger.info(f"Saved prediction for {date}: {prediction} ({confidence:.1%})")
             return True
-            
+
         except Exception as e:
             logger.error(f"Error saving prediction: {str(e)}")
             return False
-    
+
     def get_predictions_with_results(self, days: int = 30) -> List[Dict]:
         """
         Get predictions that have actual results for evaluation
-        
+
         Args:
             days: Number of days to look back
-        
+
         Returns:
             List of predictions with actual results
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-            
-            query = """
-                SELECT 
-                    date,
-                    prediction,
-                    close_price,
-                    next_day_close,
-                    CASE 
-                        WHEN next_day_close > close_price THEN 'UP'
-                        ELSE 'DOWN'
-                    END as actual_direction
-                FROM daily_data 
-                WHERE prediction IS NOT NULL 
-                AND next_day_close IS NOT NULL
-                ORDER BY date DESC 
-                LIMIT %s
-            """
-            cursor.execute(query, (days,))
-            results = cursor.fetchall()
-            
-            cursor.close()
-            conn.close()
-            
+            with self._cursor(row_factory=dict_row) as cursor:
+                cursor.execute(_Q_PREDICTIONS_WITH_RESULTS, (days,))
+                results = cursor.fetchall()
+
             return [dict(row) for row in results]
-            
+
         except Exception as e:
             logger.error(f"Error getting predictions: {str(e)}")
             return []
@@ -3,10 +3,15 @@ Logging configuration and utilities for NVIDIA Stock Prediction System
 Provides centralized logging with file and console output
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Tuple
 from config.settings import LOG_LEVEL, LOG_FILE, LOG_FORMAT, LOG_DATE_FORMAT, LOGS_DIR
 
 
@@ -24,54 +29,96 @@ class CustomFormatter(logging.Formatter):
     }
 
     def format(self, record):
-        # Add color to level name for console
-        if hasattr(sys.stdout, 'isatty') and sys.stdout.isatty():
-            levelname = record.levelname
-            if levelname in self.COLORS:
-                record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-        
+        colored = _LEVEL_COLORED.get(record.levelname)
+        if colored is None or colored == record.levelname:
+            return super().format(record)
+
+        # Shallow-copy the record so other handlers (e.g. the file
+        # handler) never see the ANSI-wrapped level name
+        record = copy.copy(record)
+        record.levelname = colored
         return super().format(record)
 
 
-def setup_logger(name: str = "nvidia_prediction", log_file: Path = LOG_FILE) -> logging.Logger:
-    """
-    Set up and configure logger with file and console handlers
-    
-    Args:
-        name: Logger name
-        log_file: Path to log file
-    
-    Returns:
-        Configured logger instance
-    """
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
-    
-    # Prevent duplicate handlers if logger already exists
-    if logger.handlers:
-        return logger
-    
+# Level name -> console display name, computed once at import instead of
+# an isatty() call plus string formatting per record. When stdout is not
+# a TTY this is an identity map and format() takes its fast path.
+_USE_COLOR = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+_LEVEL_COLORED = {
+    level: (f"{color}{level}{CustomFormatter.COLORS['RESET']}" if _USE_COLOR else level)
+    for level, color in CustomFormatter.COLORS.items()
+    if level != 'RESET'
+}
+
+
+# One queue + background listener per log file, shared by every logger
+# writing to it - callers only pay a queue.put() per record, while the
+# listener thread does the actual file/console I/O off the hot path
+_log_queues: Dict[Path, Tuple[queue.Queue, QueueListener]] = {}
+
+
+def _get_log_queue(log_file: Path) -> queue.Queue:
+    """Get (or start) the shared logging queue and listener for a log file"""
+    entry = _log_queues.get(log_file)
+    if entry is not None:
+        return entry[0]
+
     # Create formatters
     file_formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
     console_formatter = CustomFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-    
+
     # ============================================
     # FILE HANDLER - Write to log file
     # ============================================
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)  # Log everything to file
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
-    
+
     # ============================================
     # CONSOLE HANDLER - Output to console
     # ============================================
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, LOG_LEVEL.upper()))
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
+
+    # The listener drains the queue on its own thread and fans records
+    # out to both handlers, honouring each handler's own level
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler,
+                             respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    _log_queues[log_file] = (log_queue, listener)
+    return log_queue
+
+
+def setup_logger(name: str = "nvidia_prediction", log_file: Path = LOG_FILE) -> logging.Logger:
+    """
+    Set up and configure logger with file and console handlers
+
+    File and console I/O run on a shared background listener thread, so
+    log calls in tight loops never block on disk writes.
+
+    Args:
+        name: Logger name
+        log_file: Path to log file
+
+    Returns:
+        Configured logger instance
+    """
+    # Create logger
+    logger = logging.getLogger(name)
+    logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
+
+    # Prevent duplicate handlers if logger already exists
+    if logger.handlers:
+        return logger
+
+    # The only in-process handler is a cheap queue put; the listener
+    # thread owns the real file/console handlers
+    logger.addHandler(QueueHandler(_get_log_queue(log_file)))
+
     return logger
 
 
@@ -0,0 +1,81 @@
+"""
+Persistent on-disk cache for market data windows
+Stores DataFrame slices as Parquet with a JSON sidecar holding the TTL
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class FileCache:
+    """
+    TTL file cache for DataFrames
+
+    Each entry is a Parquet file plus a small .meta.json with the write
+    timestamp and TTL. Historical windows are final and can live forever
+    (ttl=None); windows that include today get a short TTL because the
+    current bar keeps changing until the close. Warm runs skip the Yahoo
+    round trip entirely.
+    """
+
+    def __init__(self, cache_dir: Path = Path(".cache") / "market_data"):
+        """
+        Initialize the cache directory (created on first use)
+
+        Args:
+            cache_dir: Directory holding the Parquet/metadata pairs
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, key: str) -> tuple:
+        """Parquet and metadata paths for a cache key"""
+        base = self.cache_dir / key
+        return base.with_suffix('.parquet'), base.with_suffix('.meta.json')
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for key, or None if absent or expired
+
+        Args:
+            key: Cache key (e.g. "NVDA_2026-01-01_2026-08-31")
+        """
+        data_path, meta_path = self._paths(key)
+        try:
+            if not data_path.exists() or not meta_path.exists():
+                return None
+
+            meta = json.loads(meta_path.read_text())
+            ttl = meta.get('ttl')
+            if ttl is not None and time.time() - meta['ts'] > ttl:
+                return None
+
+            return pd.read_parquet(data_path)
+
+        except Exception as e:
+            logger.warning(f"Market cache read failed for {key}: {str(e)}")
+            return None
+
+    def put(self, key: str, df: pd.DataFrame, ttl: Optional[float] = None) -> None:
+        """
+        Store a DataFrame under key
+
+        Args:
+            key: Cache key
+            df: DataFrame to persist
+            ttl: Seconds until the entry expires (None = never)
+        """
+        data_path, meta_path = self._paths(key)
+        try:
+            df.to_parquet(data_path)
+            meta_path.write_text(json.dumps({'ts': time.time(), 'ttl': ttl}))
+        except Exception as e:
+            logger.warning(f"Market cache write failed for {key}: {str(e)}")
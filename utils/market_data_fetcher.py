@@ -3,9 +3,11 @@ Market Data Fetcher for NVIDIA Stock
 Fetches stock data from Yahoo Finance and calculates technical indicators
 """
 
+import math
 import yfinance as yf
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from config.settings import (
@@ -18,10 +20,116 @@ from config.settings import (
     MA_LONG
 )
 from utils.logger import setup_logger
+from utils import _indicators_njit
+from utils.market_cache import FileCache
+
+# TA-Lib runs the indicators as straight C loops over the Close array -
+# roughly an order of magnitude faster than the pandas implementation.
+# It needs a native library, so it stays optional with a pandas fallback.
+try:
+    import talib
+except ImportError:
+    talib = None
+
+# One HTTP session shared by every yfinance call: the TLS handshake and
+# connection are reused across requests, and identical GETs within the
+# hour are answered from the on-disk response cache without touching the
+# network. Optional - yfinance builds its own plain session without it.
+try:
+    import requests_cache
+    _HTTP_SESSION = requests_cache.CachedSession(
+        '.cache/yf_http',
+        expire_after=3600,
+        allowable_methods=('GET',)
+    )
+except ImportError:
+    _HTTP_SESSION = None
 
 logger = setup_logger(__name__)
 
 
+def _today() -> str:
+    """Today as YYYY-MM-DD (C-implemented isoformat, no strftime)"""
+    return datetime.now().date().isoformat()
+
+
+# ============================================
+# TRADING CALENDAR CACHE
+# ============================================
+# Shared by all fetcher instances so repeated is_market_open /
+# get_last_trading_day calls don't hit Yahoo Finance again.
+# Populated once from a single wide history fetch and extended
+# lazily when a queried date falls outside the cached window.
+_TRADING_DAYS: set = set()                  # "YYYY-MM-DD" strings of open days
+_SORTED_TRADING_DAYS: tuple = ()            # sorted view for bisect lookups
+_CALENDAR_START: Optional[str] = None       # first date covered by the cache
+_CALENDAR_END: Optional[str] = None         # last date covered by the cache
+
+
+# Disk layer behind the in-memory lru_cache: survives process restarts,
+# so warm re-runs within the day skip Yahoo entirely
+_disk_cache = FileCache()
+
+# Computed indicator arrays keyed by (symbol, last bar date, bar count) -
+# for daily bars that triple uniquely identifies the Close vector, so
+# overlapping fetches in one run reuse the arrays instead of re-running
+# RSI/MACD/SMA over the same 300 bars. A plain dict rather than
+# lru_cache because ndarray inputs aren't hashable; insertion order
+# doubles as the eviction order.
+_INDICATOR_CACHE: Dict[tuple, Dict[str, np.ndarray]] = {}
+_INDICATOR_CACHE_SIZE = 32
+
+
+# In-memory layer over the disk cache, keyed by (symbol, start, end).
+# A plain dict rather than lru_cache so empty frames - yfinance's way
+# of reporting a transient failure - are never memoized: a failed fetch
+# must stay retryable, or one bad response would mark that window
+# "closed" for the process lifetime. Insertion order doubles as the
+# eviction order.
+_HISTORY_CACHE: Dict[tuple, pd.DataFrame] = {}
+_HISTORY_CACHE_SIZE = 64
+
+
+def _history_cached(symbol: str, start: str = '', end: str = '',
+                    period: str = '') -> pd.DataFrame:
+    """
+    Process-wide cache for yf.Ticker.history window calls
+
+    The workflow asks Yahoo for the same windows repeatedly (market-open
+    check then data fetch for the same date); caching turns the repeat
+    calls into dict lookups and saves a full HTTPS round trip each.
+    Window fetches are also persisted to disk: closed windows forever,
+    windows including today for an hour (the current bar still moves).
+    Only successful (non-empty) results are cached at either layer.
+    Period-based calls ("1d"/"5d") always go to Yahoo: they exist to
+    read the live bar, which must not be frozen for the process
+    lifetime. Callers must .copy() the result before mutating it.
+    """
+    ticker = yf.Ticker(symbol, session=_HTTP_SESSION)
+    if period:
+        return ticker.history(period=period, actions=False)
+
+    key = (symbol, start, end)
+    cached = _HISTORY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    df = _disk_cache.get(f"{symbol}_{start}_{end}")
+    if df is not None:
+        logger.debug(f"Market data cache hit: {symbol}_{start}_{end}")
+    else:
+        df = ticker.history(start=start, end=end, actions=False)
+        if not df.empty:
+            _disk_cache.put(f"{symbol}_{start}_{end}", df,
+                            ttl=3600 if end > _today() else None)
+
+    if not df.empty:
+        if len(_HISTORY_CACHE) >= _HISTORY_CACHE_SIZE:
+            _HISTORY_CACHE.pop(next(iter(_HISTORY_CACHE)))
+        _HISTORY_CACHE[key] = df
+    return df
+
+
 class MarketDataFetcher:
     """Fetch NVIDIA stock data and calculate technical indicators"""
     
@@ -33,8 +141,21 @@ class MarketDataFetcher:
             symbol: Stock symbol (default: NVDA)
         """
         self.symbol = symbol
-        self.ticker = yf.Ticker(symbol)
+        self._ticker = None
         logger.info(f"MarketDataFetcher initialized for {symbol}")
+
+    @property
+    def ticker(self):
+        """
+        yf.Ticker for the symbol, created on first access
+
+        Recent yfinance versions probe metadata over HTTP during Ticker
+        setup; constructing lazily keeps code paths that never touch the
+        market (DB-only summaries, tests) off the network entirely.
+        """
+        if self._ticker is None:
+            self._ticker = yf.Ticker(self.symbol, session=_HTTP_SESSION)
+        return self._ticker
     
     def fetch_daily_data(self, date: Optional[str] = None, use_last_trading_day: bool = False) -> Optional[Dict]:
         """
@@ -50,62 +171,97 @@ class MarketDataFetcher:
         try:
             # Use today's date if not specified
             if date is None:
-                date = datetime.now().strftime("%Y-%m-%d")
+                date = _today()
             
+            # Short-circuit closed days from the cached calendar - no point
+            # paying an HTTPS round trip just to learn the market was closed
+            if self._ensure_calendar(date) and date not in _TRADING_DAYS:
+                if not use_last_trading_day:
+                    logger.warning(f"No data available for {date} (market closed)")
+                    return None
+
+                # Rewind to the last open day in the cached calendar and
+                # carry on - no recursion, one window fetch
+                idx = bisect_right(_SORTED_TRADING_DAYS, date) - 1
+                if idx < 0:
+                    logger.warning(f"No trading day on record before {date}")
+                    return None
+                date = _SORTED_TRADING_DAYS[idx]
+                logger.info(f"Market closed; using last trading day: {date}")
+
             logger.info(f"Fetching market data for {self.symbol} on {date}")
-            
+
             # Calculate date range (need extra days for technical indicators)
             # Get 300 days to calculate 200-day moving average
-            end_date = datetime.strptime(date, "%Y-%m-%d")
+            end_date = datetime.fromisoformat(date)
             start_date = end_date - timedelta(days=300)
-            
-            # Download data from Yahoo Finance
-            df = self.ticker.history(
-                start=start_date.strftime("%Y-%m-%d"),
-                end=(end_date + timedelta(days=1)).strftime("%Y-%m-%d")
+
+            # Download data from Yahoo Finance (cached per window)
+            df = _history_cached(
+                self.symbol,
+                start=start_date.date().isoformat(),
+                end=(end_date + timedelta(days=1)).date().isoformat()
             )
-            
+
             if df.empty:
                 logger.error(f"No data returned for {self.symbol} (check symbol or date range)")
                 return None
-            
-            # Remove timezone from index for easier date matching
-            df.index = df.index.tz_localize(None)
+
+            # Copy before mutating so the cached frame stays pristine
+            df = df.copy()
+
+            # Remove timezone from index for easier date matching.
+            # tz_localize(None) keeps the wall-clock midnight stamps the
+            # exact-match lookup below relies on (tz_convert would shift
+            # them to UTC first); naive indexes, e.g. reloaded cache
+            # entries, are already in the right form
+            if df.index.tz is not None:
+                df.index = df.index.tz_localize(None)
             
             # Calculate technical indicators
             df = self._calculate_indicators(df)
             
-            # Get data for the specific date
-            target_date = pd.to_datetime(date)
-            if target_date not in df.index:
-                logger.warning(f"No data available for {date} (market might be closed)")
-                
-                # If requested, try to get last trading day instead
-                if use_last_trading_day:
-                    logger.info("Attempting to fetch last trading day instead...")
-                    last_day = self.get_last_trading_day()
-                    if last_day and last_day != date:
-                        logger.info(f"Using last trading day: {last_day}")
-                        return self.fetch_daily_data(last_day, use_last_trading_day=False)
-                
-                return None
-            
-            # Extract data for target date
-            row = df.loc[target_date]
-            
+            # One binary search on the raw datetime64 values both locates
+            # the date and answers whether it exists - no Timestamp
+            # allocation, no hash probe on the index
+            target = np.datetime64(date)
+            index_values = df.index.values
+            row_pos = int(index_values.searchsorted(target))
+
+            if row_pos >= len(index_values) or index_values[row_pos] != target:
+                if use_last_trading_day and row_pos > 0:
+                    # The previous trading day's bar sits right before the
+                    # insertion point - step back instead of fetching again
+                    row_pos -= 1
+                    date = np.datetime_as_string(index_values[row_pos], unit='D')
+                    logger.info(f"Using last trading day from fetched window: {date}")
+                else:
+                    logger.warning(f"No data available for {date} (market might be closed)")
+                    return None
+
+            # Read the row positionally and round each precision group in
+            # one vectorized pass - no mixed-dtype Series, no per-field
+            # Python round()/float() calls
+            prices = np.round(df[['Open', 'Close', 'High', 'Low']].to_numpy()[row_pos], 2)
+            inds_2dp = np.round(df[['RSI', 'SMA_50', 'SMA_200']].to_numpy()[row_pos], 2)
+            inds_4dp = np.round(df[['MACD', 'MACD_signal']].to_numpy()[row_pos], 4)
+
+            def _or_none(value: float) -> Optional[float]:
+                return float(value) if not math.isnan(value) else None
+
             # Prepare return data
             data = {
                 "date": date,
-                "open_price": round(float(row['Open']), 2),
-                "close_price": round(float(row['Close']), 2),
-                "high_price": round(float(row['High']), 2),
-                "low_price": round(float(row['Low']), 2),
-                "volume": int(row['Volume']),
-                "rsi": round(float(row['RSI']), 2) if pd.notna(row['RSI']) else None,
-                "macd": round(float(row['MACD']), 4) if pd.notna(row['MACD']) else None,
-                "macd_signal": round(float(row['MACD_signal']), 4) if pd.notna(row['MACD_signal']) else None,
-                "moving_avg_50": round(float(row['SMA_50']), 2) if pd.notna(row['SMA_50']) else None,
-                "moving_avg_200": round(float(row['SMA_200']), 2) if pd.notna(row['SMA_200']) else None,
+                "open_price": float(prices[0]),
+                "close_price": float(prices[1]),
+                "high_price": float(prices[2]),
+                "low_price": float(prices[3]),
+                "volume": int(df['Volume'].to_numpy()[row_pos]),
+                "rsi": _or_none(inds_2dp[0]),
+                "macd": _or_none(inds_4dp[0]),
+                "macd_signal": _or_none(inds_4dp[1]),
+                "moving_avg_50": _or_none(inds_2dp[1]),
+                "moving_avg_200": _or_none(inds_2dp[2]),
             }
             
             logger.info(f"Successfully fetched data for {date}: Close=${data['close_price']}, Volume={data['volume']:,}")
@@ -115,6 +271,36 @@ class MarketDataFetcher:
             logger.error(f"Error fetching market data: {str(e)}")
             return None
     
+    def fetch_daily_data_with_status(self, date: Optional[str] = None) -> tuple:
+        """
+        Fetch daily data plus trading-day status in one pass
+
+        Answers "was the market open", "what is the data" and "what is
+        the last trading day" off the same cached calendar and history
+        window, so the daily workflow pays one network round trip
+        instead of one per question.
+
+        Args:
+            date: Date in YYYY-MM-DD format (default: today)
+
+        Returns:
+            Tuple of (data dict or None, is_trading_day, last_trading_day)
+        """
+        if date is None:
+            date = _today()
+
+        # One calendar load answers the open/closed question; the data
+        # fetch below reuses the same cached history window
+        if self._ensure_calendar(date):
+            is_trading_day = date in _TRADING_DAYS
+        else:
+            is_trading_day = self.is_market_open(date)
+
+        last_trading_day = self.get_last_trading_day()
+        data = self.fetch_daily_data(date) if is_trading_day else None
+
+        return data, is_trading_day, last_trading_day
+
     def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate technical indicators
@@ -126,27 +312,104 @@ class MarketDataFetcher:
             DataFrame with added technical indicators
         """
         try:
-            # RSI (Relative Strength Index)
-            df['RSI'] = ta.rsi(df['Close'], length=RSI_PERIOD)
-            
-            # MACD (Moving Average Convergence Divergence)
-            macd = ta.macd(df['Close'], fast=MACD_FAST, slow=MACD_SLOW, signal=MACD_SIGNAL)
-            if macd is not None:
-                df['MACD'] = macd[f'MACD_{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}']
-                df['MACD_signal'] = macd[f'MACDs_{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}']
-                df['MACD_hist'] = macd[f'MACDh_{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}']
-            
-            # Simple Moving Averages
-            df['SMA_50'] = ta.sma(df['Close'], length=MA_SHORT)
-            df['SMA_200'] = ta.sma(df['Close'], length=MA_LONG)
-            
+            # Reuse cached arrays when this exact Close vector was
+            # already processed (recursive fallbacks, backfill overlap)
+            key = (self.symbol, str(df.index[-1]), len(df))
+            arrays = _INDICATOR_CACHE.get(key)
+            if arrays is None:
+                arrays = self._compute_indicator_arrays(df['Close'])
+                if len(_INDICATOR_CACHE) >= _INDICATOR_CACHE_SIZE:
+                    _INDICATOR_CACHE.pop(next(iter(_INDICATOR_CACHE)))
+                _INDICATOR_CACHE[key] = arrays
+            else:
+                logger.debug(f"Indicator cache hit for {key}")
+
+            # One assign for all six columns - a single new frame layout
+            # instead of one BlockManager re-layout per column write
+            df = df.assign(**arrays)
+
             logger.debug(f"Calculated technical indicators for {len(df)} days")
             return df
-            
+
         except Exception as e:
             logger.error(f"Error calculating indicators: {str(e)}")
             return df
-    
+
+    def _compute_indicator_arrays(self, close: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        Run the indicator kernels over a Close series
+
+        Args:
+            close: Close prices, oldest first
+
+        Returns:
+            Dict of column name -> indicator array (RSI, MACD, MACD_signal,
+            MACD_hist, SMA_50, SMA_200)
+        """
+        if talib is not None:
+            # Fast path: C implementations over the raw ndarray
+            close_arr = close.to_numpy(dtype=np.float64)
+
+            rsi = talib.RSI(close_arr, timeperiod=RSI_PERIOD)
+            macd_line, macd_signal, macd_hist = talib.MACD(
+                close_arr,
+                fastperiod=MACD_FAST,
+                slowperiod=MACD_SLOW,
+                signalperiod=MACD_SIGNAL
+            )
+            sma_50 = talib.SMA(close_arr, timeperiod=MA_SHORT)
+            sma_200 = talib.SMA(close_arr, timeperiod=MA_LONG)
+            backend = 'talib'
+
+        elif _indicators_njit.HAVE_NUMBA:
+            # Second choice: compiled njit loops over the raw ndarray
+            close_arr = close.to_numpy(dtype=np.float64)
+
+            rsi = _indicators_njit.rsi(close_arr, RSI_PERIOD)
+            macd_line, macd_signal, macd_hist = _indicators_njit.macd(
+                close_arr, MACD_FAST, MACD_SLOW, MACD_SIGNAL
+            )
+            sma_50 = _indicators_njit.sma(close_arr, MA_SHORT)
+            sma_200 = _indicators_njit.sma(close_arr, MA_LONG)
+            backend = 'numba'
+
+        else:
+            # Pandas fallback
+            # RSI (Relative Strength Index) - Wilder smoothing via ewm
+            delta = close.diff()
+            gain = delta.clip(lower=0).ewm(alpha=1 / RSI_PERIOD, adjust=False).mean()
+            loss = (-delta.clip(upper=0)).ewm(alpha=1 / RSI_PERIOD, adjust=False).mean()
+            rsi = 100 - 100 / (1 + gain / loss)
+
+            # MACD (Moving Average Convergence Divergence)
+            ema_fast = close.ewm(span=MACD_FAST, adjust=False).mean()
+            ema_slow = close.ewm(span=MACD_SLOW, adjust=False).mean()
+            macd_line = ema_fast - ema_slow
+            macd_signal = macd_line.ewm(span=MACD_SIGNAL, adjust=False).mean()
+            macd_hist = macd_line - macd_signal
+
+            # Simple Moving Averages
+            sma_50 = close.rolling(window=MA_SHORT).mean()
+            sma_200 = close.rolling(window=MA_LONG).mean()
+            backend = 'pandas'
+
+        logger.debug(f"Computed indicator arrays for {len(close)} bars ({backend})")
+
+        # Plain ndarrays so cached entries don't pin old DataFrame
+        # indexes. Kernels run in float64 for stable recurrences, but the
+        # outputs are stored as float32 - indicators get rounded to 2-4
+        # decimals downstream anyway, and halving the bytes helps the
+        # cached arrays and historical frames stay resident
+        return {
+            'RSI': np.asarray(rsi, dtype=np.float32),
+            'MACD': np.asarray(macd_line, dtype=np.float32),
+            'MACD_signal': np.asarray(macd_signal, dtype=np.float32),
+            'MACD_hist': np.asarray(macd_hist, dtype=np.float32),
+            'SMA_50': np.asarray(sma_50, dtype=np.float32),
+            'SMA_200': np.asarray(sma_200, dtype=np.float32),
+        }
+
+
     def fetch_historical_data(self, days: int = 100) -> Optional[pd.DataFrame]:
         """
         Fetch historical data for multiple days
@@ -160,22 +423,32 @@ class MarketDataFetcher:
         try:
             logger.info(f"Fetching {days} days of historical data for {self.symbol}")
             
-            # Calculate date range
+            # Calculate date range: enough warmup for the longest
+            # indicator (200-day SMA dominates), converted from trading
+            # days to calendar days with a holiday buffer - rather than
+            # a flat 300 extra days fetched and discarded
+            warmup = max(MA_LONG, MACD_SLOW + MACD_SIGNAL)
             end_date = datetime.now()
-            start_date = end_date - timedelta(days=days + 300)  # Extra for indicators
+            start_date = end_date - timedelta(days=int((days + warmup) * 1.45) + 20)
             
-            # Download data
-            df = self.ticker.history(
-                start=start_date.strftime("%Y-%m-%d"),
-                end=end_date.strftime("%Y-%m-%d")
+            # Download data (cached per window)
+            df = _history_cached(
+                self.symbol,
+                start=start_date.date().isoformat(),
+                end=end_date.date().isoformat()
             )
-            
+
             if df.empty:
                 logger.error("No historical data returned")
                 return None
-            
-            # Remove timezone from index
-            df.index = df.index.tz_localize(None)
+
+            # Copy before mutating so the cached frame stays pristine
+            df = df.copy()
+
+            # Remove timezone from index, keeping wall-clock dates
+            # (skip when already naive)
+            if df.index.tz is not None:
+                df.index = df.index.tz_localize(None)
             
             # Calculate indicators
             df = self._calculate_indicators(df)
@@ -198,7 +471,7 @@ class MarketDataFetcher:
             Current stock price or None if failed
         """
         try:
-            data = self.ticker.history(period="1d")
+            data = _history_cached(self.symbol, period="1d")
             if not data.empty:
                 price = float(data['Close'].iloc[-1])
                 logger.info(f"Latest {self.symbol} price: ${price:.2f}")
@@ -208,57 +481,120 @@ class MarketDataFetcher:
             logger.error(f"Error getting latest price: {str(e)}")
             return None
     
+    def _ensure_calendar(self, date: str) -> bool:
+        """
+        Make sure the cached trading calendar covers a specific date
+
+        Fetches one wide history window (365 days back from today or the
+        requested date, whichever is earlier) and caches the trading days,
+        so later lookups are pure set/bisect operations with no network I/O.
+
+        Args:
+            date: Date in YYYY-MM-DD format that must be covered
+
+        Returns:
+            True if the cache covers the date, False otherwise
+        """
+        global _TRADING_DAYS, _SORTED_TRADING_DAYS, _CALENDAR_START, _CALENDAR_END
+
+        if _CALENDAR_START is not None and _CALENDAR_START <= date <= _CALENDAR_END:
+            return True
+
+        try:
+            today = _today()
+            start_date = datetime.fromisoformat(min(date, today)) - timedelta(days=365)
+            end_date = datetime.fromisoformat(today) + timedelta(days=1)
+
+            df = _history_cached(
+                self.symbol,
+                start=start_date.date().isoformat(),
+                end=end_date.date().isoformat()
+            )
+
+            if df.empty:
+                logger.error("Cannot build trading calendar - no data available")
+                return False
+
+            index = df.index.tz_localize(None) if df.index.tz is not None else df.index
+            _TRADING_DAYS.update(d.date().isoformat() for d in index)
+            _SORTED_TRADING_DAYS = tuple(sorted(_TRADING_DAYS))
+            _CALENDAR_START = start_date.date().isoformat()
+            _CALENDAR_END = today
+
+            logger.debug(f"Cached trading calendar: {len(_TRADING_DAYS)} days ({_CALENDAR_START} to {_CALENDAR_END})")
+            return _CALENDAR_START <= date <= _CALENDAR_END
+
+        except Exception as e:
+            logger.error(f"Error building trading calendar: {str(e)}")
+            return False
+
     def is_market_open(self, date: Optional[str] = None) -> bool:
         """
         Check if market was open on a specific date
-        
+
         Args:
             date: Date in YYYY-MM-DD format (default: today)
-        
+
         Returns:
             True if market was open, False otherwise
         """
         try:
             if date is None:
-                date = datetime.now().strftime("%Y-%m-%d")
-            
-            # Try to fetch data for that date
-            target_date = datetime.strptime(date, "%Y-%m-%d")
-            df = self.ticker.history(
-                start=target_date.strftime("%Y-%m-%d"),
-                end=(target_date + timedelta(days=1)).strftime("%Y-%m-%d")
+                date = _today()
+
+            # Fast path: answer from the cached trading calendar
+            if self._ensure_calendar(date):
+                is_open = date in _TRADING_DAYS
+                logger.info(f"Market {'was open' if is_open else 'was closed'} on {date}")
+                return is_open
+
+            # Fallback: probe Yahoo Finance for that single date
+            target_date = datetime.fromisoformat(date)
+            df = _history_cached(
+                self.symbol,
+                start=date,
+                end=(target_date + timedelta(days=1)).date().isoformat()
             )
-            
+
             is_open = not df.empty
             logger.info(f"Market {'was open' if is_open else 'was closed'} on {date}")
             return is_open
-            
+
         except Exception as e:
             logger.error(f"Error checking market status: {str(e)}")
             return False
-    
+
     def get_last_trading_day(self) -> Optional[str]:
         """
         Get the most recent trading day (handles weekends/holidays)
-        
+
         Returns:
             Date string in YYYY-MM-DD format or None if error
         """
         try:
-            # Get last 5 days of data to ensure we catch the last trading day
-            df = self.ticker.history(period="5d")
-            
+            today = _today()
+
+            # Fast path: bisect the cached trading calendar
+            if self._ensure_calendar(today) and _SORTED_TRADING_DAYS:
+                idx = bisect_right(_SORTED_TRADING_DAYS, today)
+                if idx > 0:
+                    last_date = _SORTED_TRADING_DAYS[idx - 1]
+                    logger.info(f"Last trading day: {last_date}")
+                    return last_date
+
+            # Fallback: get last 5 days of data to catch the last trading day
+            df = _history_cached(self.symbol, period="5d")
+
             if df.empty:
                 logger.error("Cannot determine last trading day - no data available")
                 return None
-            
-            # Remove timezone and get the last date
-            df.index = df.index.tz_localize(None)
-            last_date = df.index[-1].strftime("%Y-%m-%d")
-            
+
+            # The last bar's date (timezone irrelevant for a date string)
+            last_date = df.index[-1].date().isoformat()
+
             logger.info(f"Last trading day: {last_date}")
             return last_date
-            
+
         except Exception as e:
             logger.error(f"Error getting last trading day: {str(e)}")
             return None
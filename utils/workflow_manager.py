@@ -3,6 +3,8 @@ Workflow Manager for handling weekend news and sentiment updates
 Manages the logic of accumulating weekend articles and updating last trading day
 """
 
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Optional, List, Dict
 from utils.database_manager import DatabaseManager
@@ -12,14 +14,30 @@ from utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+def _today() -> str:
+    """Today as YYYY-MM-DD (C-implemented isoformat, no strftime)"""
+    return datetime.now().date().isoformat()
+
+
 class WorkflowManager:
     """Manage daily workflow including weekend article handling"""
     
     def __init__(self):
         """Initialize workflow manager"""
         self.db = DatabaseManager()
-        self.fetcher = MarketDataFetcher()
+        self._fetcher: Optional[MarketDataFetcher] = None
         logger.info("WorkflowManager initialized")
+
+    @property
+    def fetcher(self) -> MarketDataFetcher:
+        """Market data fetcher, created on first access
+
+        DB-only paths (e.g. the count and last-day fields of
+        get_summary) never pay the fetcher's setup cost.
+        """
+        if self._fetcher is None:
+            self._fetcher = MarketDataFetcher()
+        return self._fetcher
     
     def should_collect_market_data(self, date: Optional[str] = None) -> bool:
         """
@@ -32,8 +50,8 @@ class WorkflowManager:
             True if market data should be collected, False if weekend/holiday
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
-        
+            date = _today()
+
         is_open = self.fetcher.is_market_open(date)
         logger.info(f"Market {'open' if is_open else 'closed'} on {date}")
         return is_open
@@ -68,7 +86,7 @@ class WorkflowManager:
             Tuple of (start_date, end_date) for article collection
         """
         if target_date is None:
-            target_date = datetime.now().strftime("%Y-%m-%d")
+            target_date = _today()
         
         is_trading_day = self.fetcher.is_market_open(target_date)
         
@@ -86,7 +104,45 @@ class WorkflowManager:
             logger.info(f"Non-trading day: Accumulating articles from {last_trading_day} to {target_date}")
             return (last_trading_day, target_date)
     
-    def process_daily_workflow(self, date: Optional[str] = None, 
+    def classify_dates(self, dates: List[str]) -> pd.DataFrame:
+        """
+        Classify a batch of dates in one pass
+
+        Answers is_trading_day, the sentiment date range, and the last
+        trading day for every date using the fetcher's cached trading
+        calendar - one calendar load instead of a round trip per date
+        per question.
+
+        Args:
+            dates: List of dates in YYYY-MM-DD format
+
+        Returns:
+            DataFrame with columns: date, is_trading_day, sentiment_start,
+            sentiment_end, last_trading_day
+        """
+        # Resolved once for the whole batch (DB first, then market data)
+        last_trading_day = self.get_last_trading_day_for_update()
+
+        rows = []
+        for date in dates:
+            is_trading = self.fetcher.is_market_open(date)
+            if is_trading:
+                start, end = date, date
+            else:
+                start, end = (last_trading_day or date), date
+
+            rows.append({
+                "date": date,
+                "is_trading_day": is_trading,
+                "sentiment_start": start,
+                "sentiment_end": end,
+                "last_trading_day": last_trading_day,
+            })
+
+        logger.info(f"Classified {len(rows)} dates against cached trading calendar")
+        return pd.DataFrame(rows)
+
+    def process_daily_workflow(self, date: Optional[str] = None,
                                articles: Optional[List[Dict]] = None,
                                sentiment_score: Optional[float] = None) -> Dict:
         """
@@ -101,8 +157,8 @@ class WorkflowManager:
             Dictionary with workflow results
         """
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
-        
+            date = _today()
+
         logger.info(f"Processing workflow for {date}")
         
         result = {
@@ -114,15 +170,16 @@ class WorkflowManager:
             "target_date_for_sentiment": None
         }
         
-        # Check if market is open
-        is_trading_day = self.should_collect_market_data(date)
+        # One combined call answers market status, data and last trading
+        # day instead of three separate fetcher round trips
+        market_data, is_trading_day, last_trading_day = \
+            self.fetcher.fetch_daily_data_with_status(date)
         result["is_trading_day"] = is_trading_day
-        
+
         if is_trading_day:
-            # TRADING DAY: Fetch and save market data
+            # TRADING DAY: Save the fetched market data
             logger.info(f"Trading day: Fetching market data for {date}")
-            market_data = self.fetcher.fetch_daily_data(date)
-            
+
             if market_data:
                 success = self.db.save_daily_data(market_data)
                 result["market_data_saved"] = success
@@ -130,12 +187,11 @@ class WorkflowManager:
             else:
                 logger.warning(f"No market data available for {date}")
             
-            # Save articles for today
+            # Save articles for today in one batched round trip
             if articles:
                 for article in articles:
                     article['date'] = date
-                    self.db.save_article(article)
-                result["articles_saved"] = len(articles)
+                result["articles_saved"] = self.db.save_articles_bulk(articles)
             
             # Update sentiment for today
             if sentiment_score is not None:
@@ -146,18 +202,19 @@ class WorkflowManager:
         else:
             # WEEKEND/HOLIDAY: Update last trading day's sentiment
             logger.info(f"Non-trading day: Updating last trading day with accumulated sentiment")
-            
-            last_trading_day = self.get_last_trading_day_for_update()
+
+            # Prefer the database's notion of the last stored day, falling
+            # back to the value the fetcher already computed above
+            last_trading_day = self.db.get_last_trading_day_date() or last_trading_day
             if not last_trading_day:
                 logger.error("No last trading day found - database might be empty")
                 return result
             
-            # Save articles with today's date
+            # Save articles with today's date in one batched round trip
             if articles:
                 for article in articles:
                     article['date'] = date
-                    self.db.save_article(article)
-                result["articles_saved"] = len(articles)
+                result["articles_saved"] = self.db.save_articles_bulk(articles)
             
             # Update last trading day's sentiment with accumulated score
             if sentiment_score is not None:
@@ -168,6 +225,53 @@ class WorkflowManager:
         
         return result
     
+    def process_date_range(self, dates: List[str],
+                           articles_per_date: Optional[Dict[str, List[Dict]]] = None,
+                           sentiment_per_date: Optional[Dict[str, float]] = None) -> List[Dict]:
+        """
+        Process several dates' workflows concurrently (for backfills)
+
+        Yahoo round trips dominate a backfill; running the per-date
+        workflows on a thread pool overlaps the network waits. The
+        database side is already thread-safe - each worker borrows its
+        own pooled connection.
+
+        Args:
+            dates: Dates to process in YYYY-MM-DD format
+            articles_per_date: Optional articles keyed by date
+            sentiment_per_date: Optional sentiment scores keyed by date
+
+        Returns:
+            List of workflow result dicts, in the same order as dates
+        """
+        if not dates:
+            return []
+
+        articles_per_date = articles_per_date or {}
+        sentiment_per_date = sentiment_per_date or {}
+        results_by_date: Dict[str, Dict] = {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(dates))) as executor:
+            futures = {
+                executor.submit(
+                    self.process_daily_workflow,
+                    date,
+                    articles_per_date.get(date),
+                    sentiment_per_date.get(date)
+                ): date
+                for date in dates
+            }
+            for future in as_completed(futures):
+                date = futures[future]
+                try:
+                    results_by_date[date] = future.result()
+                except Exception as e:
+                    logger.error(f"Workflow failed for {date}: {str(e)}")
+                    results_by_date[date] = {"date": date, "error": str(e)}
+
+        logger.info(f"Processed {len(results_by_date)} dates concurrently")
+        return [results_by_date[date] for date in dates]
+
     def get_articles_for_sentiment_calculation(self, date: Optional[str] = None) -> List[Dict]:
         """
         Get all relevant articles for sentiment calculation